@@ -7,6 +7,7 @@ import os
 import logging
 import argparse
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import warnings
 
 # Suppress specific NumPy warnings that occur in the TA library
@@ -35,6 +36,7 @@ def main():
     parser = argparse.ArgumentParser(description='Run backtests for multiple cryptocurrencies with their specialized strategies')
     parser.add_argument('--days', type=int, default=30, help='Number of days to backtest')
     parser.add_argument('--coins', nargs='+', default=None, help='Specific coins to backtest (e.g., BTC ETH)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Number of backtests to run in parallel')
     args = parser.parse_args()
     
     # Define the coins and their optimized strategies
@@ -68,11 +70,9 @@ def main():
     # Calculate start date
     start_date = f"{args.days} days ago"
     
-    # Run backtest for each coin with its specialized strategy
-    logger.info(f"Starting backtest for {len(coins_strategies)} coins over {args.days} days")
+    # Build the list of backtests to run - one per coin and timeframe
+    jobs = []
     for symbol, strategy_name in coins_strategies.items():
-        logger.info(f"Backtesting {symbol} with {strategy_name} strategy")
-        
         # Define timeframes based on the coin's strategy
         if symbol in ['BTCUSDT', 'XRPUSDT', 'DOGEUSDT']:
             timeframes = ['1m', '3m', '5m']
@@ -83,21 +83,37 @@ def main():
         else:
             timeframes = ['15m']
         
-        coin_results = {}
-        
-        # Run backtest for each timeframe
         for timeframe in timeframes:
-            logger.info(f"Running {symbol} on {timeframe} timeframe")
-            result = run_backtest(
+            jobs.append((symbol, strategy_name, timeframe))
+    
+    # Backtests are independent and CPU-bound, so run them in separate processes
+    logger.info(f"Starting backtest for {len(coins_strategies)} coins over {args.days} days "
+                f"({len(jobs)} runs, {args.workers} workers)")
+    job_results = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {}
+        for symbol, strategy_name, timeframe in jobs:
+            logger.info(f"Running {symbol} with {strategy_name} strategy on {timeframe} timeframe")
+            future = executor.submit(
+                run_backtest,
                 symbol=symbol,
                 timeframe=timeframe,
                 strategy_name=strategy_name,
                 start_date=start_date,
                 save_results=True
             )
+            futures[future] = (symbol, timeframe)
+        
+        for future in as_completed(futures):
+            symbol, timeframe = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Backtest worker failed for {symbol} on {timeframe}: {e}")
+                result = None
             
             if result:
-                coin_results[timeframe] = {
+                job_results[(symbol, timeframe)] = {
                     'total_return': result.get('total_return', 0),
                     'win_rate': result.get('win_rate', 0),
                     'max_drawdown': result.get('max_drawdown', 0),
@@ -111,8 +127,11 @@ def main():
                            f"Sharpe: {result.get('sharpe_ratio', 0):.2f}")
             else:
                 logger.error(f"Backtest failed for {symbol} on {timeframe}")
-        
-        results[symbol] = coin_results
+    
+    # Collect results in the original coin/timeframe order
+    for symbol, strategy_name, timeframe in jobs:
+        if (symbol, timeframe) in job_results:
+            results.setdefault(symbol, {})[timeframe] = job_results[(symbol, timeframe)]
     
     # Print summary of results
     logger.info("\n\nBacktest Results Summary:")
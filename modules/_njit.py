@@ -0,0 +1,17 @@
+"""
+Optional numba support.
+Exposes `njit` and `HAS_NUMBA`; when numba is not installed `njit` is a no-op
+decorator so kernels still run as plain Python.
+"""
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit supporting both @njit and @njit(...)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -19,7 +19,7 @@ from modules.config import (
     LEVERAGE, STOP_LOSS_PCT, TAKE_PROFIT_PCT, BACKTEST_USE_AUTO_COMPOUND,
     COMPOUND_REINVEST_PERCENT
 )
-from modules.strategies import get_strategy, TradingStrategy
+from modules.strategies import create_strategy, TradingStrategy
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +31,8 @@ class Backtester:
         self.start_date = start_date
         self.end_date = end_date or datetime.now().strftime("%Y-%m-%d")
         
-        # Initialize strategy
-        self.strategy = get_strategy(strategy_name)
+        # Initialize strategy - a fresh instance so no state carries over from other backtests
+        self.strategy = create_strategy(strategy_name)
         
         # Setup initial values
         self.initial_balance = BACKTEST_INITIAL_BALANCE
@@ -542,9 +542,7 @@ class Backtester:
             
             try:
                 # Resample to monthly returns
-                monthly_returns = equity_df['daily_return'].resample('ME').apply(
-                    lambda x: (1 + x).prod() - 1
-                ) * 100
+                monthly_returns = ((1 + equity_df['daily_return']).resample('ME').prod() - 1) * 100
                 
                 # Convert to dataframe for pivot_table operation
                 monthly_returns_df = monthly_returns.reset_index()
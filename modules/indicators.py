@@ -0,0 +1,465 @@
+"""
+Compiled indicator kernels used by the trading strategies.
+Kernels return numpy arrays aligned with the input bars and of the input dtype,
+so float32 input gives float32 output; running sums and EMAs are kept in float64.
+"""
+import numpy as np
+
+from modules._njit import HAS_NUMBA, njit
+
+# Set once warm_up has compiled (or loaded from cache) every kernel in this process
+_warmed_up = False
+
+
+@njit(cache=True)
+def rolling_max_min(high, low, period):
+    """Rolling max of high and rolling min of low in one pass (NaN until the window fills)"""
+    n = high.shape[0]
+    max_out = np.full(n, np.nan, high.dtype)
+    min_out = np.full(n, np.nan, low.dtype)
+
+    # Monotonic deques of bar indexes, stored in preallocated arrays
+    max_q = np.empty(n, np.int64)
+    min_q = np.empty(n, np.int64)
+    max_head = 0
+    max_tail = 0
+    min_head = 0
+    min_tail = 0
+
+    for i in range(n):
+        while max_tail > max_head and high[max_q[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_q[max_tail] = i
+        max_tail += 1
+        if max_q[max_head] <= i - period:
+            max_head += 1
+
+        while min_tail > min_head and low[min_q[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_q[min_tail] = i
+        min_tail += 1
+        if min_q[min_head] <= i - period:
+            min_head += 1
+
+        if i >= period - 1:
+            max_out[i] = high[max_q[max_head]]
+            min_out[i] = low[min_q[min_head]]
+
+    return max_out, min_out
+
+
+@njit(cache=True)
+def rolling_sum(values, window):
+    """Rolling sum over a fixed window (NaN until the window fills), as differences of one cumulative sum"""
+    n = values.shape[0]
+    out = np.full(n, np.nan, values.dtype)
+    if window <= n:
+        cumsum = np.zeros(n + 1)
+        cumsum[1:] = np.cumsum(values)
+        out[window - 1:] = cumsum[window:] - cumsum[:n + 1 - window]
+    return out
+
+
+@njit(cache=True)
+def bbands(close, period, nbdev):
+    """
+    Bollinger Bands (high, mid, low) with population standard deviation.
+    Welford's running mean/variance over a sliding window gives both moments in one pass.
+    """
+    n = close.shape[0]
+    bb_high = np.full(n, np.nan, close.dtype)
+    bb_mid = np.full(n, np.nan, close.dtype)
+    bb_low = np.full(n, np.nan, close.dtype)
+
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = close[i]
+        if i < period:
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        else:
+            old = close[i - period]
+            old_mean = mean
+            mean += (x - old) / period
+            m2 += (x - old) * (x - mean + old - old_mean)
+        if i >= period - 1:
+            var = m2 / period
+            std = np.sqrt(var) if var > 0.0 else 0.0
+            bb_mid[i] = mean
+            bb_high[i] = mean + nbdev * std
+            bb_low[i] = mean - nbdev * std
+
+    return bb_high, bb_mid, bb_low
+
+
+@njit(cache=True)
+def fused_indicators(close, bb_period, bb_std, macd_fast, macd_slow, macd_signal, rsi_period):
+    """
+    Bollinger Bands, MACD and RSI of close in a single pass.
+    Returns (bb_high, bb_mid, bb_low, macd, macd_signal, macd_hist, rsi) with
+    TA-Lib's seeding: SMA-seeded EMAs for MACD and Wilder smoothing for RSI.
+    """
+    n = close.shape[0]
+    bb_high = np.full(n, np.nan, close.dtype)
+    bb_mid = np.full(n, np.nan, close.dtype)
+    bb_low = np.full(n, np.nan, close.dtype)
+    macd = np.full(n, np.nan, close.dtype)
+    macd_sig = np.full(n, np.nan, close.dtype)
+    macd_hist = np.full(n, np.nan, close.dtype)
+    rsi = np.full(n, np.nan, close.dtype)
+
+    # Bollinger state - Welford's running mean and sum of squared deviations over the window
+    mean = 0.0
+    m2 = 0.0
+
+    # MACD state - both EMAs are seeded so their first values land on bar macd_slow - 1
+    k_fast = 2.0 / (macd_fast + 1)
+    k_slow = 2.0 / (macd_slow + 1)
+    k_sig = 2.0 / (macd_signal + 1)
+    fast_start = macd_slow - macd_fast
+    fast_sum = 0.0
+    slow_sum = 0.0
+    sig_sum = 0.0
+    ema_fast = 0.0
+    ema_slow = 0.0
+    ema_sig = 0.0
+
+    # RSI state - Wilder averages of gains and losses
+    gain = 0.0
+    loss = 0.0
+
+    for i in range(n):
+        x = close[i]
+
+        # Bollinger Bands (population standard deviation)
+        if i < bb_period:
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        else:
+            old = close[i - bb_period]
+            old_mean = mean
+            mean += (x - old) / bb_period
+            m2 += (x - old) * (x - mean + old - old_mean)
+        if i >= bb_period - 1:
+            var = m2 / bb_period
+            std = np.sqrt(var) if var > 0.0 else 0.0
+            bb_mid[i] = mean
+            bb_high[i] = mean + bb_std * std
+            bb_low[i] = mean - bb_std * std
+
+        # MACD
+        if i < macd_slow:
+            slow_sum += x
+            if i >= fast_start:
+                fast_sum += x
+            if i == macd_slow - 1:
+                ema_slow = slow_sum / macd_slow
+                ema_fast = fast_sum / macd_fast
+        else:
+            ema_slow = (x - ema_slow) * k_slow + ema_slow
+            ema_fast = (x - ema_fast) * k_fast + ema_fast
+        if i >= macd_slow - 1:
+            m = ema_fast - ema_slow
+            j = i - (macd_slow - 1)
+            if j < macd_signal:
+                sig_sum += m
+                if j == macd_signal - 1:
+                    ema_sig = sig_sum / macd_signal
+            else:
+                ema_sig = (m - ema_sig) * k_sig + ema_sig
+            if j >= macd_signal - 1:
+                macd[i] = m
+                macd_sig[i] = ema_sig
+                macd_hist[i] = m - ema_sig
+
+        # RSI
+        if i > 0:
+            diff = x - close[i - 1]
+            if i > rsi_period:
+                gain *= rsi_period - 1
+                loss *= rsi_period - 1
+            if diff < 0:
+                loss -= diff
+            else:
+                gain += diff
+            if i >= rsi_period:
+                gain /= rsi_period
+                loss /= rsi_period
+                total = gain + loss
+                rsi[i] = 100.0 * (gain / total) if total >= 1e-8 else 0.0
+
+    return bb_high, bb_mid, bb_low, macd, macd_sig, macd_hist, rsi
+
+
+@njit(cache=True, error_model='numpy')
+def grid_indicators(close, high, low, ema_short, ema_medium, ema_long, atr_period,
+                    bb_period, bb_std, rsi_period, k_period, d_period):
+    """
+    EMAs, ATR, Bollinger Bands, RSI and Stochastic of one bar series in a single pass.
+    Returns (ema_short, ema_medium, ema_long, atr, bb_high, bb_mid, bb_low, rsi, stoch_k, stoch_d)
+    following the `ta` library: EMAs seeded with the first close, Wilder ATR seeded with the
+    mean true range (zero before that) and Wilder-smoothed RSI.
+    """
+    n = close.shape[0]
+    ema_s = np.full(n, np.nan, close.dtype)
+    ema_m = np.full(n, np.nan, close.dtype)
+    ema_l = np.full(n, np.nan, close.dtype)
+    atr = np.zeros(n, close.dtype)
+    bb_high = np.full(n, np.nan, close.dtype)
+    bb_mid = np.full(n, np.nan, close.dtype)
+    bb_low = np.full(n, np.nan, close.dtype)
+    rsi = np.full(n, np.nan, close.dtype)
+    stoch_k = np.full(n, np.nan, close.dtype)
+    stoch_d = np.full(n, np.nan, close.dtype)
+
+    # EMA state - pandas ewm(adjust=False) recurrences
+    alpha_s = 2.0 / (ema_short + 1)
+    alpha_m = 2.0 / (ema_medium + 1)
+    alpha_l = 2.0 / (ema_long + 1)
+    alpha_rsi = 1.0 / rsi_period
+    es = 0.0
+    em = 0.0
+    el = 0.0
+
+    # ATR state
+    tr_sum = 0.0
+    atr_prev = 0.0
+
+    # Bollinger state - Welford's running mean and sum of squared deviations over the window
+    mean = 0.0
+    m2 = 0.0
+
+    # RSI state - smoothed gains and losses
+    avg_up = 0.0
+    avg_down = 0.0
+
+    for i in range(n):
+        x = close[i]
+
+        # EMAs
+        if i == 0:
+            es = x
+            em = x
+            el = x
+        else:
+            # Mirrors pandas ewm(adjust=False) step for step: pandas skips the update when the value
+            # equals the input and divides by the summed weights, which rounds differently from a
+            # plain es + alpha * (x - es). Keep both so that, for the float64 bars the strategy
+            # passes, the EMAs are bit-identical to ta's.
+            if es != x:
+                es = ((1.0 - alpha_s) * es + alpha_s * x) / ((1.0 - alpha_s) + alpha_s)
+            if em != x:
+                em = ((1.0 - alpha_m) * em + alpha_m * x) / ((1.0 - alpha_m) + alpha_m)
+            if el != x:
+                el = ((1.0 - alpha_l) * el + alpha_l * x) / ((1.0 - alpha_l) + alpha_l)
+        if i >= ema_short - 1:
+            ema_s[i] = es
+        if i >= ema_medium - 1:
+            ema_m[i] = em
+        if i >= ema_long - 1:
+            ema_l[i] = el
+
+        # ATR
+        tr = high[i] - low[i]
+        if i > 0:
+            tr = max(tr, abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        if i < atr_period:
+            tr_sum += tr
+            if i == atr_period - 1:
+                atr_prev = tr_sum / atr_period
+                atr[i] = atr_prev
+        else:
+            atr_prev = (atr_prev * (atr_period - 1) + tr) / atr_period
+            atr[i] = atr_prev
+
+        # Bollinger Bands (population standard deviation)
+        if i < bb_period:
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        else:
+            old = close[i - bb_period]
+            old_mean = mean
+            mean += (x - old) / bb_period
+            m2 += (x - old) * (x - mean + old - old_mean)
+        if i >= bb_period - 1:
+            var = m2 / bb_period
+            std = np.sqrt(var) if var > 0.0 else 0.0
+            bb_mid[i] = mean
+            bb_high[i] = mean + bb_std * std
+            bb_low[i] = mean - bb_std * std
+
+        # RSI - the first bar has no change and counts as flat
+        up = 0.0
+        down = 0.0
+        if i > 0:
+            diff = x - close[i - 1]
+            if diff > 0:
+                up = diff
+            elif diff < 0:
+                down = -diff
+        if i == 0:
+            avg_up = up
+            avg_down = down
+        else:
+            if avg_up != up:
+                avg_up = ((1.0 - alpha_rsi) * avg_up + alpha_rsi * up) / ((1.0 - alpha_rsi) + alpha_rsi)
+            if avg_down != down:
+                avg_down = ((1.0 - alpha_rsi) * avg_down + alpha_rsi * down) / ((1.0 - alpha_rsi) + alpha_rsi)
+        if i >= rsi_period - 1:
+            rsi[i] = 100.0 if avg_down == 0 else 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+
+        # Stochastic %K over the window's high/low, %D as its moving average
+        if i >= k_period - 1:
+            lowest = low[i]
+            highest = high[i]
+            for j in range(i - k_period + 1, i):
+                lowest = min(lowest, low[j])
+                highest = max(highest, high[j])
+            stoch_k[i] = 100.0 * (x - lowest) / (highest - lowest)
+        if i >= k_period + d_period - 2:
+            k_total = 0.0
+            for j in range(i - d_period + 1, i + 1):
+                k_total += stoch_k[j]
+            stoch_d[i] = k_total / d_period
+
+    return ema_s, ema_m, ema_l, atr, bb_high, bb_mid, bb_low, rsi, stoch_k, stoch_d
+
+
+@njit(cache=True)
+def _directional_index(tr_sum, plus_dm, minus_dm):
+    """DX from the smoothed true range and directional movements"""
+    plus_di = 100.0 * (plus_dm / tr_sum) if tr_sum != 0 else 0.0
+    minus_di = 100.0 * (minus_dm / tr_sum) if tr_sum != 0 else 0.0
+    if plus_di + minus_di == 0:
+        return 0.0
+    return 100.0 * abs((plus_di - minus_di) / (plus_di + minus_di))
+
+
+@njit(cache=True)
+def _directional_movement(prev_high, prev_low, prev_close, high, low, close):
+    """True range, +DM and -DM of a bar given the previous one"""
+    tr = max(high, prev_close) - min(low, prev_close)
+    up = high - prev_high
+    down = prev_low - low
+    plus_dm = up if up > down and up > 0 else 0.0
+    minus_dm = down if down > up and down > 0 else 0.0
+    return tr, plus_dm, minus_dm
+
+
+@njit(cache=True)
+def adx_step(adx_value, tr_sum, plus_dm, minus_dm, prev_high, prev_low, prev_close,
+             high, low, close, period):
+    """
+    Fold one more bar into the Wilder ADX state.
+    Returns the new (adx, smoothed true range, smoothed +DM, smoothed -DM).
+    """
+    tr, up, down = _directional_movement(prev_high, prev_low, prev_close, high, low, close)
+    tr_sum = tr_sum - tr_sum / period + tr
+    plus_dm = plus_dm - plus_dm / period + up
+    minus_dm = minus_dm - minus_dm / period + down
+    adx_value = (adx_value * (period - 1) + _directional_index(tr_sum, plus_dm, minus_dm)) / period
+    return adx_value, tr_sum, plus_dm, minus_dm
+
+
+@njit(cache=True)
+def adx(high, low, close, period):
+    """
+    Wilder ADX after the last bar, seeded like the `ta` library's ADXIndicator.
+    Returns (adx, smoothed true range, smoothed +DM, smoothed -DM) so later bars can be
+    folded in with adx_step; adx is NaN when there are fewer than 2 * period bars.
+    """
+    n = close.shape[0]
+    if n < 2 * period:
+        return np.nan, 0.0, 0.0, 0.0
+
+    # Seed the smoothed sums with the first period bars after the first close
+    tr_sum = 0.0
+    plus_dm = 0.0
+    minus_dm = 0.0
+    for i in range(1, period + 1):
+        tr, up, down = _directional_movement(high[i - 1], low[i - 1], close[i - 1], high[i], low[i], close[i])
+        tr_sum += tr
+        plus_dm += up
+        minus_dm += down
+
+    # The first ADX is the mean DX of the next period bars
+    dx_total = _directional_index(tr_sum, plus_dm, minus_dm)
+    for i in range(period + 1, 2 * period):
+        tr, up, down = _directional_movement(high[i - 1], low[i - 1], close[i - 1], high[i], low[i], close[i])
+        tr_sum = tr_sum - tr_sum / period + tr
+        plus_dm = plus_dm - plus_dm / period + up
+        minus_dm = minus_dm - minus_dm / period + down
+        dx_total += _directional_index(tr_sum, plus_dm, minus_dm)
+    adx_value = dx_total / period
+
+    for i in range(2 * period, n):
+        adx_value, tr_sum, plus_dm, minus_dm = adx_step(
+            adx_value, tr_sum, plus_dm, minus_dm,
+            high[i - 1], low[i - 1], close[i - 1], high[i], low[i], close[i], period
+        )
+    return adx_value, tr_sum, plus_dm, minus_dm
+
+
+@njit(cache=True)
+def supertrend(close, basic_upperband, basic_lowerband):
+    """
+    Supertrend direction and line from the basic ATR bands.
+    Returns (direction, supertrend, final_upperband, final_lowerband); bands only
+    ratchet while price stays between them.
+    """
+    n = close.shape[0]
+    direction = np.ones(n, np.int64)
+    line = np.zeros(n)
+    upperband = basic_upperband.copy()
+    lowerband = basic_lowerband.copy()
+
+    for i in range(1, n):
+        if close[i] > upperband[i - 1]:
+            direction[i] = 1
+        elif close[i] < lowerband[i - 1]:
+            direction[i] = -1
+        else:
+            direction[i] = direction[i - 1]
+
+            if direction[i] == 1 and lowerband[i] < lowerband[i - 1]:
+                lowerband[i] = lowerband[i - 1]
+
+            if direction[i] == -1 and upperband[i] > upperband[i - 1]:
+                upperband[i] = upperband[i - 1]
+
+        if direction[i] == 1:
+            line[i] = lowerband[i]
+        else:
+            line[i] = upperband[i]
+
+    return direction, line, upperband, lowerband
+
+
+def warm_up():
+    """
+    Compile (or load from the on-disk cache) every kernel for the argument types the
+    strategies pass, so the first live signal isn't held up by JIT compilation.
+    """
+    global _warmed_up
+    if _warmed_up or not HAS_NUMBA:
+        return
+
+    prices = np.linspace(1.0, 2.0, 60)
+    # Columns taken from a DataFrame are read-only under pandas copy-on-write
+    prices_readonly = prices.copy()
+    prices_readonly.flags.writeable = False
+
+    rolling_max_min(prices_readonly, prices_readonly, 9)
+    fused_indicators(prices_readonly, 20, 2.0, 12, 26, 9, 14)
+    bbands(prices_readonly, 20, 2.0)
+    grid_indicators(prices_readonly, prices_readonly, prices_readonly, 5, 21, 30, 14, 20, 2.0, 14, 14, 3)
+    supertrend(prices_readonly, prices + 1.0, prices - 1.0)
+    adx_state = adx(prices_readonly, prices_readonly, prices_readonly, 14)
+    adx_step(*adx_state, 1.0, 1.0, 1.0, 2.0, 2.0, 2.0, 14)
+    rolling_sum(prices, 14)
+    rolling_sum(prices_readonly, 14)
+    _warmed_up = True
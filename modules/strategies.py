@@ -1,8 +1,18 @@
 import logging
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 import ta
+import talib
 import time
+from typing import NamedTuple
+from numpy.lib.stride_tricks import sliding_window_view
+
+from modules._njit import HAS_NUMBA
+from modules.indicators import (
+    adx, adx_step, bbands, fused_indicators, grid_indicators, rolling_max_min, rolling_sum, supertrend,
+    warm_up
+)
 
 logger = logging.getLogger(__name__)
 
@@ -11,23 +21,60 @@ class TradingStrategy:
     def __init__(self, strategy_name):
         self.strategy_name = strategy_name
         
+        # Parsed columns of the last klines seen, reused while the klines are unchanged
+        self._klines_key = None
+        self._arrs = None
+        
+        # Extra history kept ahead of the longest indicator window so EMA-based values settle
+        self.warmup_bars = 100
+    
+    def _klines_fingerprint(self, klines):
+        """Cheap identity of a klines list: its length, first open time and last candle"""
+        # The bot polls the same (or an in-place updated) klines list repeatedly,
+        # and the backtester passes a fresh list per bar, so id(klines) can't be used
+        if not klines:
+            return None
+        return (len(klines), klines[0][0], tuple(klines[-1][:7]))
+    
+    def _klines_arrays(self, klines):
+        """Parse klines into per-column arrays, reusing the previous parse if nothing changed"""
+        key = self._klines_fingerprint(klines)
+        if key != self._klines_key:
+            n = len(klines)
+            arrs = {'open_time': pd.to_datetime([row[0] for row in klines], unit='ms')}
+            for i, col in enumerate(['open', 'high', 'low', 'close', 'volume'], start=1):
+                arrs[col] = np.fromiter((row[i] for row in klines), dtype=np.float64, count=n)
+            arrs['close_time'] = pd.to_datetime([row[6] for row in klines], unit='ms')
+            
+            self._arrs = arrs
+            self._klines_key = key
+        return self._arrs
+    
     def prepare_data(self, klines):
         """Convert raw klines to a DataFrame with OHLCV data"""
-        df = pd.DataFrame(klines, columns=[
-            'open_time', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # Convert string values to numeric
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = pd.to_numeric(df[col])
-            
-        # Convert timestamps to datetime
-        df['open_time'] = pd.to_datetime(df['open_time'], unit='ms')
-        df['close_time'] = pd.to_datetime(df['close_time'], unit='ms')
-        
-        return df
+        # Copy so indicator columns written by get_signal never touch the cached arrays
+        return pd.DataFrame(self._klines_arrays(klines), copy=True)
+    
+    def prepare_arrays(self, klines, window=None):
+        """
+        Return (opens, highs, lows, closes, volumes) as float64 arrays, skipping the DataFrame.
+        With a window, only the rows needed for indicators with that longest window are kept.
+        The arrays are shared with the klines cache and must not be modified.
+        """
+        arrs = self._klines_arrays(klines)
+        columns = tuple(arrs[col] for col in ('open', 'high', 'low', 'close', 'volume'))
+        if window is None:
+            return columns
+        bars = window + self.warmup_bars
+        return tuple(col[-bars:] for col in columns)
+    
+    def trim_data(self, df, window):
+        """Keep only the rows needed for indicators with the given longest window"""
+        # Signals only read the last couple of values, so older history is wasted work
+        bars = window + self.warmup_bars
+        if len(df) <= bars:
+            return df
+        return df.iloc[-bars:].reset_index(drop=True)
     
     def get_signal(self, klines):
         """
@@ -231,15 +278,13 @@ class BNBGridStrategy(TradingStrategy):
     def get_signal(self, klines):
         df = self.prepare_data(klines)
         
-        # Calculate Bollinger Bands for grid levels
-        bb_indicator = ta.volatility.BollingerBands(
-            close=df['close'],
-            window=self.bb_window,
-            window_dev=self.bb_std
+        # Calculate Bollinger Bands for grid levels - all three bands in a single pass
+        df['bb_high'], df['bb_mid'], df['bb_low'] = talib.BBANDS(
+            df['close'].to_numpy(dtype=np.float64),
+            timeperiod=self.bb_window,
+            nbdevup=self.bb_std,
+            nbdevdn=self.bb_std
         )
-        df['bb_high'] = bb_indicator.bollinger_hband()
-        df['bb_low'] = bb_indicator.bollinger_lband()
-        df['bb_mid'] = bb_indicator.bollinger_mavg()
         
         # Calculate RSI to detect ranging market
         df['rsi'] = ta.momentum.RSIIndicator(
@@ -334,15 +379,13 @@ class SOLSqueezeStrategy(TradingStrategy):
     def get_signal(self, klines):
         df = self.prepare_data(klines)
         
-        # Calculate Bollinger Bands
-        bb_indicator = ta.volatility.BollingerBands(
-            close=df['close'],
-            window=self.bb_window,
-            window_dev=self.bb_std
+        # Calculate Bollinger Bands - all three bands in a single pass
+        df['bb_high'], df['bb_mid'], df['bb_low'] = talib.BBANDS(
+            df['close'].to_numpy(dtype=np.float64),
+            timeperiod=self.bb_window,
+            nbdevup=self.bb_std,
+            nbdevdn=self.bb_std
         )
-        df['bb_high'] = bb_indicator.bollinger_hband()
-        df['bb_low'] = bb_indicator.bollinger_lband()
-        df['bb_mid'] = bb_indicator.bollinger_mavg()
         df['bb_width'] = (df['bb_high'] - df['bb_low']) / df['bb_mid']
         
         # Calculate ATR for Keltner Channels
@@ -576,14 +619,15 @@ class XRPScalpingStrategy(TradingStrategy):
             window=self.rsi_period
         ).rsi()
         
-        # Calculate Bollinger Bands 
-        bb_indicator = ta.volatility.BollingerBands(
-            close=df['close'],
-            window=self.bb_window,
-            window_dev=self.bb_std
+        # Calculate Bollinger Bands - only the outer bands are used
+        bb_high, _, bb_low = talib.BBANDS(
+            df['close'].to_numpy(dtype=np.float64),
+            timeperiod=self.bb_window,
+            nbdevup=self.bb_std,
+            nbdevdn=self.bb_std
         )
-        df['bb_high'] = bb_indicator.bollinger_hband()
-        df['bb_low'] = bb_indicator.bollinger_lband()
+        df['bb_high'] = bb_high
+        df['bb_low'] = bb_low
         
         # Calculate momentum
         df['price_change'] = df['close'].pct_change(3) * 100
@@ -784,50 +828,59 @@ class SHIBBreakoutStrategy(TradingStrategy):
         self.lookback_period = 10
         self.volume_multiplier = 2.0
         
+        # Last computed signal, keyed by klines fingerprint and parameters
+        self._sig_cache = None
+        
     def get_signal(self, klines):
-        df = self.prepare_data(klines)
+        """Get trading signal, reusing the last result while klines and parameters are unchanged"""
+        fingerprint = self._klines_fingerprint(klines)
+        params = (self.atr_period, self.rsi_period, self.lookback_period, self.volume_multiplier)
+        if self._sig_cache is not None and self._sig_cache[:2] == (fingerprint, params):
+            return self._sig_cache[2]
+        
+        signal = self._calculate_signal(klines)
+        self._sig_cache = (fingerprint, params, signal)
+        return signal
+    
+    def _calculate_signal(self, klines):
+        """Calculate trading signal from scratch"""
+        # Only plain arrays are needed here, so skip building a DataFrame
+        _, high, low, close, volume = self.prepare_arrays(
+            klines, max(self.atr_period, self.rsi_period, self.lookback_period, 20)
+        )
         
         # Calculate ATR for volatility
-        df['atr'] = ta.volatility.AverageTrueRange(
-            high=df['high'],
-            low=df['low'],
-            close=df['close'],
-            window=self.atr_period
-        ).average_true_range()
+        atr = talib.ATR(high, low, close, timeperiod=self.atr_period)
         
         # Calculate RSI
-        df['rsi'] = ta.momentum.RSIIndicator(
-            close=df['close'], 
-            window=self.rsi_period
-        ).rsi()
+        rsi = talib.RSI(close, timeperiod=self.rsi_period)
         
-        # Calculate volume indicators
-        df['volume_ma'] = df['volume'].rolling(window=20).mean()
-        df['volume_ratio'] = df['volume'] / df['volume_ma']
+        # The volume average needs 20 bars and breakouts compare against the window before the current bar
+        if len(close) < max(20, self.lookback_period + 1):
+            return None
         
-        # Calculate price ranges for breakout detection
-        df['highest_high'] = df['high'].rolling(window=self.lookback_period).max()
-        df['lowest_low'] = df['low'].rolling(window=self.lookback_period).min()
+        # Calculate volume indicators - only the latest ratio is used
+        volume_ma = volume[-20:].mean()
         
-        # Calculate momentum and volatility features
-        df['price_change'] = df['close'].pct_change() * 100
-        df['volatility'] = (df['atr'] / df['close']) * 100
+        # Calculate price ranges for breakout detection - only the last two windows are read
+        highest_high = sliding_window_view(high[-(self.lookback_period + 1):], self.lookback_period).max(axis=-1)
+        lowest_low = sliding_window_view(low[-(self.lookback_period + 1):], self.lookback_period).min(axis=-1)
         
         # Current values
-        current_price = df['close'].iloc[-1]
-        current_high = df['high'].iloc[-1]
-        current_low = df['low'].iloc[-1]
-        current_rsi = df['rsi'].iloc[-1]
-        current_highest_high = df['highest_high'].iloc[-1]
-        current_lowest_low = df['lowest_low'].iloc[-1]
-        current_volume_ratio = df['volume_ratio'].iloc[-1]
-        current_volatility = df['volatility'].iloc[-1]
+        current_price = close[-1]
+        current_high = high[-1]
+        current_low = low[-1]
+        current_rsi = rsi[-1]
+        current_highest_high = highest_high[-1]
+        current_lowest_low = lowest_low[-1]
+        current_volume_ratio = volume[-1] / volume_ma
+        current_volatility = atr[-1] / close[-1] * 100
         
         # Previous values
-        prev_price = df['close'].iloc[-2]
-        prev_high = df['high'].iloc[-2]
-        prev_highest_high = df['highest_high'].iloc[-2]
-        prev_lowest_low = df['lowest_low'].iloc[-2]
+        prev_price = close[-2]
+        prev_high = high[-2]
+        prev_highest_high = highest_high[-2]
+        prev_lowest_low = lowest_low[-2]
         
         # Signal logic for SHIB breakout trading
         buy_signal = False
@@ -864,15 +917,59 @@ class SHIBBreakoutStrategy(TradingStrategy):
             
         # Generate signals
         if buy_signal:
-            logger.info(f"SHIB Breakout: BUY signal - {reason}")
+            logger.info("SHIB Breakout: BUY signal - %s", reason)
             return "BUY"
         elif sell_signal:
-            logger.info(f"SHIB Breakout: SELL signal - {reason}")
+            logger.info("SHIB Breakout: SELL signal - %s", reason)
             return "SELL"
             
         return None
 
 
+# Condition bits for XRPFuturesGridStrategy's signal rules
+_PRICE_LE_BB_MID = 1 << 0
+_PRICE_GT_BB_MID = 1 << 1
+_PRICE_LT_BB_MID = 1 << 2
+_PRICE_GE_BB_HIGH = 1 << 3
+_PRICE_LT_BB_LOW = 1 << 4
+_PRICE_NEAR_BB_LOW = 1 << 5
+_PRICE_NEAR_BB_HIGH = 1 << 6
+_PRICE_AT_LOWER_GRID = 1 << 7
+_PRICE_AT_UPPER_GRID = 1 << 8
+_PRICE_ABOVE_TENKAN = 1 << 9
+_PRICE_FALLING = 1 << 10
+_RSI_RISING = 1 << 11
+_RSI_FALLING = 1 << 12
+_RSI_BELOW_60 = 1 << 13
+_RSI_ABOVE_60 = 1 << 14
+_RSI_BELOW_40 = 1 << 15
+_RSI_OVERBOUGHT = 1 << 16
+_RSI_OVERSOLD = 1 << 17
+_MACD_ABOVE_SIGNAL = 1 << 18
+_MACD_BELOW_SIGNAL = 1 << 19
+_MACD_RISING = 1 << 20
+_HIST_RISING = 1 << 21
+_HIST_FALLING = 1 << 22
+_HIST_POSITIVE = 1 << 23
+_HIST_NEGATIVE = 1 << 24
+_TK_CROSS_UP = 1 << 25
+_TK_CROSS_DOWN = 1 << 26
+_CLOUD_BULLISH = 1 << 27
+_BULLISH_CONFIRMATION = 1 << 28
+_BEARISH_CONFIRMATION = 1 << 29
+_BULLISH_CLOUD_POSITION = 1 << 30
+_BEARISH_CLOUD_POSITION = 1 << 31
+
+# Display names of XRPFuturesGridStrategy's regime branches for signal logs
+_REGIME_NAMES = {
+    'uptrend': 'Trending',
+    'downtrend': 'Trending',
+    'ranging': 'Ranging',
+    'volatile': 'Volatile',
+    'normal': 'Normal',
+}
+
+
 class XRPFuturesGridStrategy(TradingStrategy):
     """Advanced Futures Grid strategy optimized for XRP's volatility with dynamic parameter adjustment"""
     def __init__(self):
@@ -895,13 +992,74 @@ class XRPFuturesGridStrategy(TradingStrategy):
         # Parameters for dynamic adjustment
         self.volatility_lookback = 20
         self.regime_lookback = 50
-        self.last_adjustment_time = 0
+        self.last_adjustment_time = float('-inf')  # Monotonic clock - the first signal always adjusts
         self.adjustment_interval = 12  # Hours between parameter recalibrations
         self.min_grid_levels = 10
         self.max_grid_levels = 40
         self.min_grid_step = 0.25
         self.max_grid_step = 1.5
         
+        # Last computed signal, keyed by klines fingerprint and parameters
+        self._sig_cache = None
+        
+        # Compile the numba kernels now rather than on the first signal
+        warm_up()
+        
+        # Signal rules per regime branch: (side, bits that must be set, bits that must be clear, reason),
+        # first match per side wins
+        self._signal_rules = {
+            'uptrend': (
+                # Focus on pullbacks
+                ('BUY', _PRICE_LE_BB_MID | _RSI_RISING | _RSI_BELOW_60 | _PRICE_ABOVE_TENKAN | _CLOUD_BULLISH, 0,
+                 "Bullish trend pullback to midband"),
+                # Focus on overbought conditions
+                ('SELL', _PRICE_GE_BB_HIGH | _RSI_OVERBOUGHT | _RSI_FALLING | _MACD_BELOW_SIGNAL, 0,
+                 "Overbought reversal in uptrend"),
+            ),
+            'downtrend': (
+                # Only on strong reversal signals
+                ('BUY', _PRICE_LT_BB_LOW | _RSI_OVERSOLD | _RSI_RISING | _MACD_RISING | _MACD_ABOVE_SIGNAL, 0,
+                 "Potential trend reversal from oversold"),
+                # Sell rallies
+                ('SELL', _PRICE_GT_BB_MID | _PRICE_FALLING | _MACD_BELOW_SIGNAL, 0,
+                 "Selling rally in downtrend"),
+            ),
+            'ranging': (
+                # Trade the grid between the bands
+                ('BUY', _PRICE_NEAR_BB_LOW | _RSI_BELOW_40 | _RSI_RISING, 0,
+                 "Range trading buy at support"),
+                ('SELL', _PRICE_NEAR_BB_HIGH | _RSI_ABOVE_60 | _RSI_FALLING, 0,
+                 "Range trading sell at resistance"),
+            ),
+            'volatile': (
+                # More conservative - TK cross with momentum
+                ('BUY', _TK_CROSS_UP | _MACD_ABOVE_SIGNAL | _HIST_RISING | _PRICE_GT_BB_MID, 0,
+                 "Volatile market bullish TK cross with momentum"),
+                ('SELL', _TK_CROSS_DOWN | _MACD_BELOW_SIGNAL | _HIST_FALLING | _PRICE_LT_BB_MID, 0,
+                 "Volatile market bearish TK cross with momentum"),
+            ),
+            'normal': (
+                # Price at a grid edge with confirmation, otherwise an Ichimoku TK cross
+                ('BUY', _PRICE_AT_LOWER_GRID | _RSI_OVERSOLD | _RSI_RISING | _BULLISH_CONFIRMATION, 0,
+                 "Grid buy at support with bullish confirmation"),
+                ('BUY', _TK_CROSS_UP | _BULLISH_CLOUD_POSITION | _HIST_POSITIVE | _HIST_RISING, _PRICE_AT_LOWER_GRID,
+                 "Bullish TK cross with MACD confirmation"),
+                ('SELL', _PRICE_AT_UPPER_GRID | _RSI_OVERBOUGHT | _RSI_FALLING | _BEARISH_CONFIRMATION, 0,
+                 "Grid sell at resistance with bearish confirmation"),
+                ('SELL', _TK_CROSS_DOWN | _BEARISH_CLOUD_POSITION | _HIST_NEGATIVE | _HIST_FALLING, _PRICE_AT_UPPER_GRID,
+                 "Bearish TK cross with MACD confirmation"),
+            ),
+        }
+        
+    def _signal_params(self):
+        """Parameters the signal depends on; adjust_parameters changing any of them invalidates the cache"""
+        return (
+            self.grid_levels, self.bb_period, self.bb_std,
+            self.ichimoku_fast, self.ichimoku_medium, self.ichimoku_slow,
+            self.rsi_period, self.rsi_overbought, self.rsi_oversold,
+            self.macd_fast, self.macd_slow, self.macd_signal
+        )
+        
     def detect_market_regime(self, df):
         """Detect if the market is trending, ranging, or volatile"""
         # Ensure we have enough data to calculate indicators
@@ -917,24 +1075,30 @@ class XRPFuturesGridStrategy(TradingStrategy):
                 'price_trend': 0
             }
         
-        # Calculate volatility metrics
-        df['daily_range'] = (df['high'] - df['low']) / df['low'] * 100
-        
-        # Calculate directional movement
-        df['close_change'] = df['close'].pct_change()
-        df['direction'] = df['close_change'].apply(lambda x: 1 if x > 0 else -1 if x < 0 else 0)
-        df['direction_change'] = df['direction'].diff().abs()
+        high = df['high'].to_numpy()
+        low = df['low'].to_numpy()
+        close = df['close'].to_numpy()
         
         # Get recent metrics - safely
         lookback = min(self.volatility_lookback, len(df)-1)
         regime_lookback = min(self.regime_lookback, len(df)-1)
         
-        recent_volatility = df['daily_range'].tail(lookback).mean()
-        recent_direction_changes = df['direction_change'].tail(regime_lookback).sum()
+        # Calculate volatility metrics over the recent window only
+        recent_high = high[-lookback:]
+        recent_low = low[-lookback:]
+        recent_volatility = ((recent_high - recent_low) / recent_low * 100).mean()
+        
+        # Calculate directional movement - one more close than directions, one more direction than changes
+        recent_close = close[-(regime_lookback + 2):]
+        direction = np.sign(np.diff(recent_close))
+        if len(recent_close) < regime_lookback + 2:
+            # The first bar has no change and counts as flat
+            direction = np.concatenate(([0.0], direction))
+        recent_direction_changes = np.abs(np.diff(direction)).sum()
         
         # Safe calculation of price trend
         if regime_lookback > 0:
-            price_trend = (df['close'].iloc[-1] - df['close'].iloc[-regime_lookback]) / df['close'].iloc[-regime_lookback] * 100
+            price_trend = (close[-1] - close[-regime_lookback]) / close[-regime_lookback] * 100
         else:
             price_trend = 0
         
@@ -944,22 +1108,16 @@ class XRPFuturesGridStrategy(TradingStrategy):
             if adx_window < 2:
                 adx_window = 2
                 
-            adx_indicator = ta.trend.ADXIndicator(
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                window=adx_window
-            )
+            adx_value = talib.ADX(high, low, close, timeperiod=adx_window)
             
             # Handle potential NaN or division by zero issues in ADX calculation
-            adx_value = adx_indicator.adx()
-            if adx_value.iloc[-1] != adx_value.iloc[-1]:  # Check for NaN (NaN != NaN)
+            if np.isnan(adx_value[-1]):
                 adx = 15  # Default value if NaN
             else:
-                adx = adx_value.iloc[-1]
+                adx = adx_value[-1]
                 
         except Exception as e:
-            logger.warning(f"Error calculating ADX: {e}")
+            logger.warning("Error calculating ADX: %s", e)
             adx = 15  # Default value if calculation fails
         
         # Determine market regime
@@ -979,7 +1137,7 @@ class XRPFuturesGridStrategy(TradingStrategy):
     
     def adjust_parameters(self, df, regime):
         """Dynamically adjust strategy parameters based on market conditions"""
-        current_time = time.time()
+        current_time = time.monotonic()
         # Only adjust every adjustment_interval hours to avoid constant changes
         if current_time - self.last_adjustment_time < self.adjustment_interval * 3600:
             return
@@ -1002,7 +1160,7 @@ class XRPFuturesGridStrategy(TradingStrategy):
             self.rsi_overbought = 75
             self.rsi_oversold = 25
             
-            logger.info(f"XRP Strategy: Adjusted for volatile market. Grid levels={self.grid_levels}, step={self.grid_step_percent:.2f}%")
+            logger.info("XRP Strategy: Adjusted for volatile market. Grid levels=%s, step=%.2f%%", self.grid_levels, self.grid_step_percent)
             
         elif regime['trending']:
             # Fewer grid levels with narrower spacing in trending markets
@@ -1031,7 +1189,7 @@ class XRPFuturesGridStrategy(TradingStrategy):
             self.macd_fast = 8
             self.macd_slow = 21
             
-            logger.info(f"XRP Strategy: Adjusted for trending market ({regime['trend_direction']}). Grid levels={self.grid_levels}, step={self.grid_step_percent:.2f}%")
+            logger.info("XRP Strategy: Adjusted for trending market (%s). Grid levels=%s, step=%.2f%%", regime['trend_direction'], self.grid_levels, self.grid_step_percent)
             
         elif regime['ranging']:
             # More grid levels with narrower spacing in ranging markets
@@ -1046,7 +1204,7 @@ class XRPFuturesGridStrategy(TradingStrategy):
             self.rsi_overbought = 70
             self.rsi_oversold = 30
             
-            logger.info(f"XRP Strategy: Adjusted for ranging market. Grid levels={self.grid_levels}, step={self.grid_step_percent:.2f}%")
+            logger.info("XRP Strategy: Adjusted for ranging market. Grid levels=%s, step=%.2f%%", self.grid_levels, self.grid_step_percent)
             
         else:
             # Default settings for normal markets
@@ -1068,163 +1226,125 @@ class XRPFuturesGridStrategy(TradingStrategy):
         
     def get_signal(self, klines):
         """Get trading signal based on current market conditions"""
+        # Polling within the same candle gives the same answer - skip the indicator pipeline
+        fingerprint = self._klines_fingerprint(klines)
+        if self._sig_cache is not None and self._sig_cache[:2] == (fingerprint, self._signal_params()):
+            return self._sig_cache[2]
+        
+        signal = self._calculate_signal(klines)
+        
+        # Key on the parameters after the call since adjust_parameters may have changed them
+        self._sig_cache = (fingerprint, self._signal_params(), signal)
+        return signal
+    
+    def _calculate_signal(self, klines):
+        """Calculate trading signal from scratch"""
         # Convert klines to dataframe
         df = self.prepare_data(klines)
+        df = self.trim_data(df, max(
+            self.bb_period, self.macd_slow + self.macd_signal, self.ichimoku_slow,
+            2 * 14, self.regime_lookback
+        ))
         
         # Check if we have enough data for indicators
         if len(df) < 30:
-            logger.warning(f"XRP FuturesGrid: Not enough data to generate signal ({len(df)} candles)")
+            logger.warning("XRP FuturesGrid: Not enough data to generate signal (%s candles)", len(df))
             return None
             
-        # Detect market regime
+        # Detect market regime - needed every bar since the signal rules branch on it
         regime = self.detect_market_regime(df)
         
-        # Dynamically adjust parameters based on market conditions
-        self.adjust_parameters(df, regime)
+        # Dynamically adjust parameters based on market conditions, only once the recalibration interval has passed
+        if time.monotonic() - self.last_adjustment_time >= self.adjustment_interval * 3600:
+            self.adjust_parameters(df, regime)
         
-        # Calculate Bollinger Bands for dynamic grid range - safely
-        bb_period = min(self.bb_period, len(df)-1)
-        if bb_period < 2:
-            bb_period = 2
-            
-        try:
-            bb_indicator = ta.volatility.BollingerBands(
-                close=df['close'],
-                window=bb_period,
-                window_dev=self.bb_std
-            )
-            df['bb_high'] = bb_indicator.bollinger_hband()
-            df['bb_low'] = bb_indicator.bollinger_lband()
-            df['bb_mid'] = bb_indicator.bollinger_mavg()
-            df['bb_width'] = (df['bb_high'] - df['bb_low']) / df['bb_mid']
-        except Exception as e:
-            logger.warning(f"Error calculating Bollinger Bands: {e}")
-            return None
+        close = df['close'].to_numpy()
         
-        # Calculate Ichimoku Cloud components - safely
-        try:
-            ichimoku_fast = min(self.ichimoku_fast, len(df)//2)
-            ichimoku_medium = min(self.ichimoku_medium, len(df)//2)
-            ichimoku_slow = min(self.ichimoku_slow, len(df)//2)
-            
-            if ichimoku_fast < 2: ichimoku_fast = 2
-            if ichimoku_medium < 3: ichimoku_medium = 3
-            if ichimoku_slow < 5: ichimoku_slow = 5
-            
-            df['tenkan_sen'] = self._calculate_ichimoku_line(df, ichimoku_fast)
-            df['kijun_sen'] = self._calculate_ichimoku_line(df, ichimoku_medium)
-            df['senkou_span_a'] = (df['tenkan_sen'] + df['kijun_sen']) / 2
-            df['senkou_span_b'] = self._calculate_ichimoku_line(df, ichimoku_slow)
-        except Exception as e:
-            logger.warning(f"Error calculating Ichimoku: {e}")
-            return None
+        # Clamp indicator periods to the available history - safely
+        bb_period = max(min(self.bb_period, len(df)-1), 2)
         
-        # Calculate MACD - safely
-        try:
-            macd_fast = min(self.macd_fast, len(df)//2)
-            macd_slow = min(self.macd_slow, len(df)//2)
-            macd_signal = min(self.macd_signal, len(df)//2)
-            
-            if macd_fast < 2: macd_fast = 2
-            if macd_slow < 3: macd_slow = 3
-            if macd_signal < 2: macd_signal = 2
-            
-            # Ensure slow is greater than fast
-            if macd_slow <= macd_fast:
-                macd_slow = macd_fast + 1
-                
-            macd = ta.trend.MACD(
-                close=df['close'],
-                window_fast=macd_fast,
-                window_slow=macd_slow,
-                window_sign=macd_signal
-            )
-            df['macd'] = macd.macd()
-            df['macd_signal'] = macd.macd_signal()
-            df['macd_hist'] = macd.macd_diff()
-        except Exception as e:
-            logger.warning(f"Error calculating MACD: {e}")
-            return None
+        macd_fast = max(min(self.macd_fast, len(df)//2), 2)
+        macd_slow = max(min(self.macd_slow, len(df)//2), 3)
+        macd_signal = max(min(self.macd_signal, len(df)//2), 2)
+        
+        # Ensure slow is greater than fast
+        if macd_slow <= macd_fast:
+            macd_slow = macd_fast + 1
+        
+        rsi_period = max(min(self.rsi_period, len(df)//2), 2)
         
-        # Calculate RSI for trend direction - safely
+        ichimoku_fast = max(min(self.ichimoku_fast, len(df)//2), 2)
+        ichimoku_medium = max(min(self.ichimoku_medium, len(df)//2), 3)
+        ichimoku_slow = max(min(self.ichimoku_slow, len(df)//2), 5)
+        
+        # Only compute the indicators the active regime branch reads
+        if regime['trending']:
+            # Only the uptrend rules look at Tenkan-sen and the cloud
+            needs = {'bb', 'rsi', 'macd', 'ichimoku'} if regime['trend_direction'] > 0 else {'bb', 'rsi', 'macd'}
+        elif regime['ranging']:
+            needs = {'bb', 'rsi'}
+        elif regime['volatile']:
+            needs = {'bb', 'macd', 'ichimoku'}
+        else:
+            needs = {'bb', 'rsi', 'macd', 'ichimoku'}
+        
+        # Indicator arrays - only the last two values are read, so they never go into df
+        arrs = {'close': close}
+        
+        # Calculate Bollinger Bands, MACD and RSI - safely
         try:
-            rsi_period = min(self.rsi_period, len(df)//2)
-            if rsi_period < 2: rsi_period = 2
-            
-            df['rsi'] = ta.momentum.RSIIndicator(
-                close=df['close'], 
-                window=rsi_period
-            ).rsi()
+            if HAS_NUMBA and needs >= {'bb', 'rsi', 'macd'}:
+                # All three only read close, so compute them together in one pass; float64 like the
+                # per-indicator path, so values don't depend on which regime picked the path
+                (arrs['bb_high'], arrs['bb_mid'], arrs['bb_low'],
+                 arrs['macd'], arrs['macd_signal'], arrs['macd_hist'], arrs['rsi']) = fused_indicators(
+                    close, bb_period, self.bb_std, macd_fast, macd_slow, macd_signal, rsi_period
+                )
+            else:
+                if 'bb' in needs:
+                    arrs['bb_high'], arrs['bb_mid'], arrs['bb_low'] = self._compute_bb(close, bb_period)
+                if 'macd' in needs:
+                    arrs['macd'], arrs['macd_signal'], arrs['macd_hist'] = self._compute_macd(
+                        close, macd_fast, macd_slow, macd_signal
+                    )
+                if 'rsi' in needs:
+                    arrs['rsi'] = self._compute_rsi(close, rsi_period)
         except Exception as e:
-            logger.warning(f"Error calculating RSI: {e}")
+            logger.warning("Error calculating Bollinger Bands/MACD/RSI: %s", e)
             return None
         
-        # Calculate ADX for trend strength - safely
-        try:
-            adx_period = min(14, len(df)//2)
-            if adx_period < 2: adx_period = 2
-            
-            # Wrap the ADX calculation in try-except to handle divide by zero warnings
-            with np.errstate(divide='ignore', invalid='ignore'):
-                adx = ta.trend.ADXIndicator(
-                    high=df['high'],
-                    low=df['low'],
-                    close=df['close'],
-                    window=adx_period
+        # Calculate Ichimoku Cloud components - safely
+        if 'ichimoku' in needs:
+            try:
+                (arrs['tenkan_sen'], arrs['kijun_sen'],
+                 arrs['senkou_span_a'], arrs['senkou_span_b']) = self._compute_ichimoku(
+                    df, ichimoku_fast, ichimoku_medium, ichimoku_slow
                 )
-                df['adx'] = adx.adx()
-                df['adx_pos'] = adx.adx_pos()
-                df['adx_neg'] = adx.adx_neg()
-                
-                # Replace any NaN or infinity values
-                df['adx'] = df['adx'].replace([np.inf, -np.inf], np.nan).fillna(15)
-                df['adx_pos'] = df['adx_pos'].replace([np.inf, -np.inf], np.nan).fillna(20)
-                df['adx_neg'] = df['adx_neg'].replace([np.inf, -np.inf], np.nan).fillna(20)
-        except Exception as e:
-            logger.warning(f"Error calculating ADX: {e}")
-            df['adx'] = 15  # Default value if calculation fails
-            df['adx_pos'] = 20
-            df['adx_neg'] = 20
+            except Exception as e:
+                logger.warning("Error calculating Ichimoku: %s", e)
+                return None
+        
+        # Snapshot the last two rows of every value the signal logic reads in one copy;
+        # indicators the active branch doesn't read are zero placeholders
+        unused = np.zeros(2)
+        snap = np.column_stack([arrs.get(name, unused)[-2:] for name in (
+            'close', 'bb_high', 'bb_low', 'bb_mid', 'tenkan_sen', 'kijun_sen',
+            'senkou_span_a', 'senkou_span_b', 'rsi', 'macd', 'macd_signal', 'macd_hist'
+        )])
         
-        # Ensure we have at least 2 rows of valid data that aren't NaN
-        if len(df) < 2 or df['bb_high'].iloc[-1] != df['bb_high'].iloc[-1] or df['macd'].iloc[-1] != df['macd'].iloc[-1] or df['rsi'].iloc[-1] != df['rsi'].iloc[-1]:
+        # Skip signal generation if any current indicator value is still NaN
+        if np.isnan(snap[1]).any():
             logger.warning("XRP FuturesGrid: Some indicators returned NaN values, skipping signal generation")
             return None
-            
-        # Check for any remaining NaN in key indicators
-        key_indicators = ['bb_high', 'bb_low', 'macd', 'macd_signal', 'rsi', 'tenkan_sen', 'kijun_sen']
-        for indicator in key_indicators:
-            if df[indicator].iloc[-1] != df[indicator].iloc[-1]:  # Check for NaN (NaN != NaN)
-                logger.warning(f"XRP FuturesGrid: NaN value in {indicator}, skipping signal generation")
-                return None
         
         # Current values
-        try:
-            current_price = df['close'].iloc[-1]
-            current_bb_high = df['bb_high'].iloc[-1]
-            current_bb_low = df['bb_low'].iloc[-1]
-            current_bb_mid = df['bb_mid'].iloc[-1]
-            current_tenkan = df['tenkan_sen'].iloc[-1]
-            current_kijun = df['kijun_sen'].iloc[-1]
-            current_senkou_a = df['senkou_span_a'].iloc[-1]
-            current_senkou_b = df['senkou_span_b'].iloc[-1]
-            current_rsi = df['rsi'].iloc[-1]
-            current_macd = df['macd'].iloc[-1]
-            current_macd_signal = df['macd_signal'].iloc[-1]
-            current_macd_hist = df['macd_hist'].iloc[-1]
-            current_adx = df['adx'].iloc[-1]
-            
-            # Previous values
-            prev_price = df['close'].iloc[-2]
-            prev_tenkan = df['tenkan_sen'].iloc[-2]
-            prev_kijun = df['kijun_sen'].iloc[-2]
-            prev_macd = df['macd'].iloc[-2]
-            prev_macd_signal = df['macd_signal'].iloc[-2]
-            prev_macd_hist = df['macd_hist'].iloc[-2]
-            prev_rsi = df['rsi'].iloc[-2]
-        except Exception as e:
-            logger.warning(f"Error accessing indicator values: {e}")
-            return None
+        (current_price, current_bb_high, current_bb_low, current_bb_mid,
+         current_tenkan, current_kijun, current_senkou_a, current_senkou_b,
+         current_rsi, current_macd, current_macd_signal, current_macd_hist) = snap[1]
+        
+        # Previous values
+        prev_price, prev_tenkan, prev_kijun = snap[0, 0], snap[0, 4], snap[0, 5]
+        prev_rsi, prev_macd, prev_macd_signal, prev_macd_hist = snap[0, 8:12]
         
         # Calculate dynamic grid based on volatility and market regime
         grid_range = current_bb_high - current_bb_low
@@ -1234,120 +1354,93 @@ class XRPFuturesGridStrategy(TradingStrategy):
         cloud_bullish = current_senkou_a > current_senkou_b
         price_above_cloud = current_price > max(current_senkou_a, current_senkou_b)
         price_below_cloud = current_price < min(current_senkou_a, current_senkou_b)
-        is_strong_trend = current_adx > 25
         
-        # Signal logic for XRP futures grid - dynamically adjusted based on market regime
-        buy_signal = False
-        sell_signal = False
-        reason = ""
+        # Evaluate every condition up front and pack them into one bitmask
+        flags = (
+            _PRICE_LE_BB_MID * (current_price <= current_bb_mid)
+            | _PRICE_GT_BB_MID * (current_price > current_bb_mid)
+            | _PRICE_LT_BB_MID * (current_price < current_bb_mid)
+            | _PRICE_GE_BB_HIGH * (current_price >= current_bb_high)
+            | _PRICE_LT_BB_LOW * (current_price < current_bb_low)
+            | _PRICE_NEAR_BB_LOW * (current_price <= current_bb_low * 1.01)
+            | _PRICE_NEAR_BB_HIGH * (current_price >= current_bb_high * 0.99)
+            | _PRICE_AT_LOWER_GRID * (current_price <= current_bb_low + grid_step)
+            | _PRICE_AT_UPPER_GRID * (current_price >= current_bb_high - grid_step)
+            | _PRICE_ABOVE_TENKAN * (current_price > current_tenkan)
+            | _PRICE_FALLING * (current_price < prev_price)
+            | _RSI_RISING * (current_rsi > prev_rsi)
+            | _RSI_FALLING * (current_rsi < prev_rsi)
+            | _RSI_BELOW_60 * (current_rsi < 60)
+            | _RSI_ABOVE_60 * (current_rsi > 60)
+            | _RSI_BELOW_40 * (current_rsi < 40)
+            | _RSI_OVERBOUGHT * (current_rsi > self.rsi_overbought)
+            | _RSI_OVERSOLD * (current_rsi < self.rsi_oversold)
+            | _MACD_ABOVE_SIGNAL * (current_macd > current_macd_signal)
+            | _MACD_BELOW_SIGNAL * (current_macd < current_macd_signal)
+            | _MACD_RISING * (current_macd > prev_macd)
+            | _HIST_RISING * (current_macd_hist > prev_macd_hist)
+            | _HIST_FALLING * (current_macd_hist < prev_macd_hist)
+            | _HIST_POSITIVE * (current_macd_hist > 0)
+            | _HIST_NEGATIVE * (current_macd_hist < 0)
+            | _TK_CROSS_UP * ((current_tenkan > current_kijun) & (prev_tenkan <= prev_kijun))
+            | _TK_CROSS_DOWN * ((current_tenkan < current_kijun) & (prev_tenkan >= prev_kijun))
+            | _CLOUD_BULLISH * cloud_bullish
+            | _BULLISH_CONFIRMATION * (cloud_bullish | (current_macd > current_macd_signal))
+            | _BEARISH_CONFIRMATION * ((not cloud_bullish) | (current_macd < current_macd_signal))
+            | _BULLISH_CLOUD_POSITION * (price_above_cloud | (cloud_bullish & (current_price > current_bb_mid)))
+            | _BEARISH_CLOUD_POSITION * (price_below_cloud | ((not cloud_bullish) & (current_price < current_bb_mid)))
+        )
         
-        # Dynamically adjust entry/exit conditions based on market regime
+        # Entry/exit rules depend on the market regime
         if regime['trending']:
-            if regime['trend_direction'] > 0:  # Uptrend
-                # BUY conditions for uptrend - focus on pullbacks
-                if (current_price <= current_bb_mid and
-                    current_rsi > prev_rsi and current_rsi < 60 and
-                    current_price > current_tenkan and
-                    cloud_bullish):
-                    buy_signal = True
-                    reason = "Bullish trend pullback to midband"
-                
-                # SELL conditions for uptrend - focus on overbought conditions
-                if (current_price >= current_bb_high and
-                    current_rsi > self.rsi_overbought and
-                    current_rsi < prev_rsi and
-                    current_macd < current_macd_signal):
-                    sell_signal = True
-                    reason = "Overbought reversal in uptrend"
-                    
-            else:  # Downtrend
-                # BUY conditions for downtrend - only on strong reversal signals
-                if (current_price < current_bb_low and
-                    current_rsi < self.rsi_oversold and
-                    current_rsi > prev_rsi and
-                    current_macd > prev_macd and
-                    current_macd > current_macd_signal):
-                    buy_signal = True
-                    reason = "Potential trend reversal from oversold"
-                
-                # SELL conditions for downtrend - sell rallies
-                if (current_price > current_bb_mid and
-                    current_price < prev_price and
-                    current_macd < current_macd_signal):
-                    sell_signal = True
-                    reason = "Selling rally in downtrend"
-        
+            branch = 'uptrend' if regime['trend_direction'] > 0 else 'downtrend'
         elif regime['ranging']:
-            # BUY conditions for ranging market - focus on grid levels
-            if (current_price <= current_bb_low * 1.01):  # Price near lower BB
-                if (current_rsi < 40 and current_rsi > prev_rsi):
-                    buy_signal = True
-                    reason = "Range trading buy at support"
-            
-            # SELL conditions for ranging market
-            if (current_price >= current_bb_high * 0.99):  # Price near upper BB
-                if (current_rsi > 60 and current_rsi < prev_rsi):
-                    sell_signal = True
-                    reason = "Range trading sell at resistance"
-        
+            branch = 'ranging'
         elif regime['volatile']:
-            # BUY conditions for volatile market - more conservative
-            if (current_tenkan > current_kijun and prev_tenkan <= prev_kijun):  # TK Cross
-                if (current_macd > current_macd_signal and 
-                    current_macd_hist > prev_macd_hist and
-                    current_price > current_bb_mid):
-                    buy_signal = True
-                    reason = "Volatile market bullish TK cross with momentum"
-            
-            # SELL conditions for volatile market - capture quick profits
-            if (current_tenkan < current_kijun and prev_tenkan >= prev_kijun):  # TK Cross
-                if (current_macd < current_macd_signal and 
-                    current_macd_hist < prev_macd_hist and
-                    current_price < current_bb_mid):
-                    sell_signal = True
-                    reason = "Volatile market bearish TK cross with momentum"
-        
+            branch = 'volatile'
         else:
-            # Default BUY conditions for normal market
-            # Condition 1: Price at lower grid with bullish indicators
-            if (current_price <= (current_bb_low + grid_step)):
-                if (current_rsi < self.rsi_oversold and current_rsi > prev_rsi):
-                    if (cloud_bullish or current_macd > current_macd_signal):
-                        buy_signal = True
-                        reason = "Grid buy at support with bullish confirmation"
-            
-            # Condition 2: Ichimoku TK cross in bullish market
-            elif (current_tenkan > current_kijun and prev_tenkan <= prev_kijun):
-                if price_above_cloud or (cloud_bullish and current_price > current_bb_mid):
-                    if current_macd_hist > 0 and current_macd_hist > prev_macd_hist:
-                        buy_signal = True
-                        reason = "Bullish TK cross with MACD confirmation"
-            
-            # Default SELL conditions for normal market
-            # Condition 1: Price at upper grid with bearish indicators
-            if (current_price >= (current_bb_high - grid_step)):
-                if (current_rsi > self.rsi_overbought and current_rsi < prev_rsi):
-                    if (not cloud_bullish or current_macd < current_macd_signal):
-                        sell_signal = True
-                        reason = "Grid sell at resistance with bearish confirmation"
-            
-            # Condition 2: Ichimoku TK cross in bearish market
-            elif (current_tenkan < current_kijun and prev_tenkan >= prev_kijun):
-                if price_below_cloud or (not cloud_bullish and current_price < current_bb_mid):
-                    if current_macd_hist < 0 and current_macd_hist < prev_macd_hist:
-                        sell_signal = True
-                        reason = "Bearish TK cross with MACD confirmation"
+            branch = 'normal'
+        
+        buy_reason = None
+        sell_reason = None
+        for side, required, excluded, reason in self._signal_rules[branch]:
+            if (flags & required) == required and not (flags & excluded):
+                if side == 'BUY' and buy_reason is None:
+                    buy_reason = reason
+                elif side == 'SELL' and sell_reason is None:
+                    sell_reason = reason
         
         # Generate signals
-        if buy_signal:
-            logger.info(f"XRP FuturesGrid: BUY signal - {reason} [Regime: {'Trending' if regime['trending'] else 'Ranging' if regime['ranging'] else 'Volatile' if regime['volatile'] else 'Normal'}]")
+        if buy_reason:
+            logger.info("XRP FuturesGrid: BUY signal - %s [Regime: %s]", buy_reason, _REGIME_NAMES[branch])
             return "BUY"
-        elif sell_signal:
-            logger.info(f"XRP FuturesGrid: SELL signal - {reason} [Regime: {'Trending' if regime['trending'] else 'Ranging' if regime['ranging'] else 'Volatile' if regime['volatile'] else 'Normal'}]")
+        elif sell_reason:
+            logger.info("XRP FuturesGrid: SELL signal - %s [Regime: %s]", sell_reason, _REGIME_NAMES[branch])
             return "SELL"
             
         return None
     
+    def _compute_bb(self, close, period):
+        """Bollinger Bands (high, mid, low) of close"""
+        if HAS_NUMBA:
+            return bbands(close, period, self.bb_std)
+        return talib.BBANDS(close, timeperiod=period, nbdevup=self.bb_std, nbdevdn=self.bb_std)
+    
+    def _compute_macd(self, close, fast, slow, signal):
+        """MACD line, signal line and histogram of close"""
+        return talib.MACD(close, fastperiod=fast, slowperiod=slow, signalperiod=signal)
+    
+    def _compute_rsi(self, close, period):
+        """RSI of close"""
+        return talib.RSI(close, timeperiod=period)
+    
+    def _compute_ichimoku(self, df, fast, medium, slow):
+        """Ichimoku Tenkan-sen, Kijun-sen, Senkou Span A and Senkou Span B"""
+        tenkan_sen = self._calculate_ichimoku_line(df, fast).to_numpy()
+        kijun_sen = self._calculate_ichimoku_line(df, medium).to_numpy()
+        senkou_span_b = self._calculate_ichimoku_line(df, slow).to_numpy()
+        return tenkan_sen, kijun_sen, (tenkan_sen + kijun_sen) / 2, senkou_span_b
+    
     def _calculate_ichimoku_line(self, df, period):
         """Helper method to calculate Ichimoku lines with safety checks"""
         if len(df) < period:
@@ -1357,9 +1450,15 @@ class XRPFuturesGridStrategy(TradingStrategy):
             
         # Safe calculation with fallback
         try:
-            high_period = df['high'].rolling(window=period).max()
-            low_period = df['low'].rolling(window=period).min()
-            result = (high_period + low_period) / 2
+            if HAS_NUMBA:
+                high_period, low_period = rolling_max_min(
+                    df['high'].to_numpy(), df['low'].to_numpy(), period
+                )
+                result = pd.Series((high_period + low_period) / 2, index=df.index)
+            else:
+                high_period = df['high'].rolling(window=period).max()
+                low_period = df['low'].rolling(window=period).min()
+                result = (high_period + low_period) / 2
             
             # Fill NaN values with rolling average of price
             if result.isna().any():
@@ -1368,11 +1467,50 @@ class XRPFuturesGridStrategy(TradingStrategy):
             
             return result
         except Exception as e:
-            logger.warning(f"Error in _calculate_ichimoku_line: {e}")
+            logger.warning("Error in _calculate_ichimoku_line: %s", e)
             # Fallback to simple moving average
             return df['close'].rolling(window=max(2, period)).mean().fillna(df['close'])
 
 
+class MarketCondition(NamedTuple):
+    """Market condition detected by SOL FuturesGrid"""
+    volatile: bool
+    trending: bool
+    ranging: bool
+    trend_direction: int
+    supertrend_direction: int
+    volatility: float
+    adx: float
+    price_change: float
+    volume_change: float
+
+
+# SOL FuturesGrid market condition codes, indexing _CONDITION_NAMES and the strategy's signal handlers
+_NORMAL, _TRENDING, _RANGING, _VOLATILE = range(4)
+_CONDITION_NAMES = ('Normal', 'Trending', 'Ranging', 'Volatile')
+
+# Indicator values SOL FuturesGrid reads for the current and previous bar
+_SNAPSHOT_COLUMNS = (
+    'close', 'ema_short', 'ema_medium', 'ema_long', 'atr',
+    'bb_high', 'bb_low', 'bb_mid', 'rsi', 'stoch_k', 'stoch_d',
+    'cum_delta', 'obv', 'vwap'
+)
+
+# One float64 field per snapshot column, so a bar's values are a single contiguous record
+_SNAPSHOT_DTYPE = np.dtype([(name, np.float64) for name in _SNAPSHOT_COLUMNS])
+
+
+class _TradeStats:
+    """Win/loss tally of closed trades between auto-optimizations"""
+    __slots__ = ('wins', 'losses', 'profit', 'drawdown')
+    
+    def __init__(self):
+        self.wins = 0
+        self.losses = 0
+        self.profit = 0.0
+        self.drawdown = 0.0
+
+
 class SOLFuturesGridStrategy(TradingStrategy):
     """Advanced Futures Grid strategy for SOL with volatility-adjusted levels and dynamic parameter optimization"""
     def __init__(self):
@@ -1396,7 +1534,7 @@ class SOLFuturesGridStrategy(TradingStrategy):
         # Parameters for dynamic adjustment
         self.volatility_lookback = 20
         self.regime_lookback = 50
-        self.last_adjustment_time = 0
+        self.last_adjustment_time = float('-inf')  # Monotonic clock - the first signal always adjusts
         self.adjustment_interval = 12  # Hours between parameter recalibrations
         self.min_grid_levels = 8
         self.max_grid_levels = 30
@@ -1406,106 +1544,169 @@ class SOLFuturesGridStrategy(TradingStrategy):
         # Parameters for auto-optimization
         self.optimization_counter = 0
         self.optimization_interval = 168  # Hours (1 week)
-        self.trade_results = {
-            'wins': 0,
-            'losses': 0,
-            'profit': 0,
-            'drawdown': 0
-        }
+        self.trade_results = _TradeStats()
+        
+        # Last detected market condition and computed signal, keyed by the bars and parameters they depend on
+        self._cond_cache = None
+        self._sig_cache = None
+        
+        # Wilder ADX state through the last closed bar: (period, adx, smoothed TR, +DM, -DM, open time)
+        self._adx_state = None
+        
+        # Compile the numba kernels now rather than on the first signal
+        warm_up()
+        
+    def _signal_params(self):
+        """Parameters the signal depends on; adjustments changing any of them invalidate the cache"""
+        return (
+            self.ema_short, self.ema_medium, self.ema_long, self.atr_period,
+            self.bb_period, self.bb_std, self.rsi_period, self.rsi_overbought, self.rsi_oversold,
+            self.stoch_k, self.stoch_d, self.vwap_window
+        )
+        
+    def _bars_fingerprint(self, df):
+        """Cheap identity of a bar DataFrame: its length, first open time and last bar"""
+        if len(df) == 0:
+            return None
+        return (len(df), df['open_time'].iat[0]) + tuple(
+            df[col].iat[-1] for col in ('open_time', 'open', 'high', 'low', 'close', 'volume')
+        )
         
     def detect_market_condition(self, df):
-        """Detect current market condition for SOL"""
+        """Detect current market condition for SOL, reusing the last result while the bars are unchanged"""
+        # Polling within the same candle gives the same bars - skip Supertrend, ATR and ADX
+        key = (self._bars_fingerprint(df), self.atr_period, self.volatility_lookback, self.regime_lookback)
+        if self._cond_cache is not None and self._cond_cache[0] == key:
+            return self._cond_cache[1]
+        
+        condition = self._detect_market_condition(df)
+        self._cond_cache = (key, condition)
+        return condition
+        
+    def _current_adx(self, df, period):
+        """
+        ADX of the last bar, folding only the bars added since the previous call into the
+        stored Wilder state instead of recomputing it over the whole history
+        """
+        high = df['high'].to_numpy()
+        low = df['low'].to_numpy()
+        close = df['close'].to_numpy()
+        open_time = df['open_time'].to_numpy()
+        
+        # Resume only for the same series over the same window: the first bar and the stored bar
+        # (open time and close) must match. Another symbol with the same timestamps, or a window
+        # that trim_data has slid forward, gets a full computation so the value always equals a
+        # fresh adx() over these bars.
+        start = None
+        state = self._adx_state
+        if state is not None and state[:3] == (period, open_time[0], close[0]):
+            pos = np.searchsorted(open_time, state[-2])
+            if pos < len(df) - 1 and open_time[pos] == state[-2] and close[pos] == state[-1]:
+                start = pos
+        
+        if start is None:
+            adx_value, tr_sum, plus_dm, minus_dm = adx(high[:-1], low[:-1], close[:-1], period)
+            if np.isnan(adx_value):
+                return adx_value
+        else:
+            adx_value, tr_sum, plus_dm, minus_dm = state[3:7]
+            for i in range(start + 1, len(df) - 1):
+                adx_value, tr_sum, plus_dm, minus_dm = adx_step(
+                    adx_value, tr_sum, plus_dm, minus_dm,
+                    high[i - 1], low[i - 1], close[i - 1], high[i], low[i], close[i], period
+                )
+        self._adx_state = (
+            period, open_time[0], close[0], adx_value, tr_sum, plus_dm, minus_dm, open_time[-2], close[-2]
+        )
+        
+        # The last bar may still be forming, so fold it in without keeping the result
+        return adx_step(
+            adx_value, tr_sum, plus_dm, minus_dm,
+            high[-2], low[-2], close[-2], high[-1], low[-1], close[-1], period
+        )[0]
+        
+    def _detect_market_condition(self, df):
+        """Detect current market condition for SOL from scratch"""
+        df = self.trim_data(df, max(
+            2 * self.atr_period, 2 * 14, self.volatility_lookback, self.regime_lookback
+        ))
+        
         # Safety check to ensure we have enough data
         if len(df) < max(30, self.volatility_lookback):
             # Default market condition for insufficient data
-            return {
-                'volatile': False,
-                'trending': False,
-                'ranging': True,  # Default to ranging
-                'trend_direction': 0,
-                'supertrend_direction': 1,
-                'volatility': 3.0,
-                'adx': 15,
-                'price_change': 0,
-                'volume_change': 0
-            }
+            return MarketCondition(
+                volatile=False,
+                trending=False,
+                ranging=True,  # Default to ranging
+                trend_direction=0,
+                supertrend_direction=1,
+                volatility=3.0,
+                adx=15,
+                price_change=0,
+                volume_change=0
+            )
+        
+        # Intermediate series stay plain arrays - nothing here is attached to df
+        close = df['close'].to_numpy()
+        volume = df['volume'].to_numpy()
         
         # Calculate volatility metrics safely
         try:
             atr_period = min(self.atr_period, len(df)//2)
             if atr_period < 2: atr_period = 2
             
-            df['atr'] = ta.volatility.AverageTrueRange(
+            atr = ta.volatility.AverageTrueRange(
                 high=df['high'],
                 low=df['low'],
                 close=df['close'],
                 window=atr_period
-            ).average_true_range()
+            ).average_true_range().to_numpy()
             
-            df['atr_pct'] = (df['atr'] / df['close']) * 100
+            atr_pct = (atr / close) * 100
         except Exception as e:
             logger.warning(f"Error calculating ATR: {e}")
             # Create default values
-            df['atr'] = df['close'] * 0.01  # 1% of price as default
-            df['atr_pct'] = 1.0  # Default 1% volatility
+            atr = close * 0.01  # 1% of price as default
+            atr_pct = np.ones(len(df))  # Default 1% volatility
         
         # Calculate momentum metrics - safe periods
         try:
             lookback = min(5, len(df)-1)
-            df['close_change'] = df['close'].pct_change(periods=lookback) * 100
-            df['volume_change'] = df['volume'].pct_change(periods=lookback) * 100
+            volume_change = np.full(len(df), np.nan)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                volume_change[lookback:] = (volume[lookback:] / volume[:-lookback] - 1) * 100
         except Exception as e:
             logger.warning(f"Error calculating momentum metrics: {e}")
-            df['close_change'] = 0
-            df['volume_change'] = 0
+            volume_change = np.zeros(len(df))
+        
+        # Calculate safe lookback periods
+        lookback = min(self.volatility_lookback, len(df)-1)
+        regime_lookback = min(self.regime_lookback, len(df)-1)
         
         # Initialize direction array with defaults
-        df['direction'] = 1
+        direction = np.ones(len(df), dtype=np.int64)
         
         # Calculate trend metrics with Supertrend - only if enough data
         if len(df) > self.atr_period * 2:
             try:
-                atr_multiplier = 3.0
-                df['basic_upperband'] = (df['high'] + df['low']) / 2 + atr_multiplier * df['atr']
-                df['basic_lowerband'] = (df['high'] + df['low']) / 2 - atr_multiplier * df['atr']
+                # Only the last regime_lookback + 1 directions are read, so scan just those
+                # plus enough bars before them for the ratcheting bands to settle
+                start = max(0, len(df) - (regime_lookback + 1) - max(self.atr_period * 2, 50))
                 
-                # Initialize Supertrend columns
-                df['supertrend'] = 0
-                df['direction'] = 1
+                atr_multiplier = 3.0
+                hl2 = (df['high'].to_numpy()[start:] + df['low'].to_numpy()[start:]) / 2
+                band_offset = atr_multiplier * atr[start:]
                 
-                # Calculate Supertrend
-                for i in range(1, len(df)):
-                    if df['close'].iloc[i] > df['basic_upperband'].iloc[i-1]:
-                        df.loc[df.index[i], 'direction'] = 1
-                    elif df['close'].iloc[i] < df['basic_lowerband'].iloc[i-1]:
-                        df.loc[df.index[i], 'direction'] = -1
-                    else:
-                        df.loc[df.index[i], 'direction'] = df['direction'].iloc[i-1]
-                        
-                        if (df['direction'].iloc[i] == 1 and 
-                            df['basic_lowerband'].iloc[i] < df['basic_lowerband'].iloc[i-1]):
-                            df.loc[df.index[i], 'basic_lowerband'] = df['basic_lowerband'].iloc[i-1]
-                            
-                        if (df['direction'].iloc[i] == -1 and 
-                            df['basic_upperband'].iloc[i] > df['basic_upperband'].iloc[i-1]):
-                            df.loc[df.index[i], 'basic_upperband'] = df['basic_upperband'].iloc[i-1]
-                            
-                    if df['direction'].iloc[i] == 1:
-                        df.loc[df.index[i], 'supertrend'] = df['basic_lowerband'].iloc[i]
-                    else:
-                        df.loc[df.index[i], 'supertrend'] = df['basic_upperband'].iloc[i]
+                # Calculate Supertrend - the bar-by-bar recursion runs in a compiled loop over plain arrays
+                direction[start:] = supertrend(close[start:], hl2 + band_offset, hl2 - band_offset)[0]
             except Exception as e:
                 logger.warning(f"Error calculating Supertrend: {e}")
                 # Keep the default direction array
-                
-        # Calculate safe lookback periods
-        lookback = min(self.volatility_lookback, len(df)-1)
-        regime_lookback = min(self.regime_lookback, len(df)-1)
         
         # Get recent metrics - safely
         try:
-            recent_volatility = df['atr_pct'].tail(lookback).mean()
-            recent_volume_change = df['volume_change'].tail(lookback).mean()
+            recent_volatility = np.nanmean(atr_pct[-lookback:])
+            recent_volume_change = np.nanmean(volume_change[-lookback:])
         except Exception as e:
             logger.warning(f"Error calculating recent metrics: {e}")
             recent_volatility = 3.0  # Default value
@@ -1514,7 +1715,7 @@ class SOLFuturesGridStrategy(TradingStrategy):
         # Safe calculation of price change
         try:
             if regime_lookback > 0 and len(df) > regime_lookback:
-                price_change = (df['close'].iloc[-1] / df['close'].iloc[-regime_lookback] - 1) * 100
+                price_change = (close[-1] / close[-regime_lookback] - 1) * 100
             else:
                 price_change = 0
         except Exception as e:
@@ -1526,27 +1727,20 @@ class SOLFuturesGridStrategy(TradingStrategy):
             adx_period = min(14, len(df)//2)
             if adx_period < 2: adx_period = 2
             
-            adx_indicator = ta.trend.ADXIndicator(
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                window=adx_period
-            )
-            
             # Handle potential NaN or division by zero issues in ADX calculation
-            adx_value = adx_indicator.adx()
-            if adx_value.iloc[-1] != adx_value.iloc[-1]:  # Check for NaN (NaN != NaN)
+            adx = self._current_adx(df, adx_period)
+            if np.isnan(adx):
                 adx = 15  # Default value if NaN
-            else:
-                adx = adx_value.iloc[-1]
         except Exception as e:
             logger.warning(f"Error calculating ADX: {e}")
             adx = 15  # Default value if calculation fails
         
         # Calculate average directional change
         try:
-            df['direction_change'] = df['direction'].diff().abs()
-            avg_direction_change = df['direction_change'].tail(regime_lookback).mean()
+            if direction.size > regime_lookback:
+                avg_direction_change = float(np.abs(np.diff(direction[-(regime_lookback + 1):])).mean())
+            else:
+                avg_direction_change = 0.05  # Default value
         except Exception as e:
             logger.warning(f"Error calculating direction changes: {e}")
             avg_direction_change = 0.05  # Default value
@@ -1559,35 +1753,35 @@ class SOLFuturesGridStrategy(TradingStrategy):
         
         # Get the current trend direction from Supertrend - safely
         try:
-            current_supertrend_direction = df['direction'].iloc[-1]
+            current_supertrend_direction = direction[-1]
         except Exception as e:
             logger.warning(f"Error getting supertrend direction: {e}")
             current_supertrend_direction = trend_direction or 1  # Default to trend direction or bullish
         
-        return {
-            'volatile': is_volatile,
-            'trending': is_trending,
-            'ranging': is_ranging,
-            'trend_direction': trend_direction,
-            'supertrend_direction': current_supertrend_direction,
-            'volatility': recent_volatility,
-            'adx': adx,
-            'price_change': price_change,
-            'volume_change': recent_volume_change
-        }
+        return MarketCondition(
+            volatile=is_volatile,
+            trending=is_trending,
+            ranging=is_ranging,
+            trend_direction=trend_direction,
+            supertrend_direction=current_supertrend_direction,
+            volatility=recent_volatility,
+            adx=adx,
+            price_change=price_change,
+            volume_change=recent_volume_change
+        )
     
     def adjust_parameters(self, df, condition):
         """Dynamically adjust strategy parameters based on market conditions"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Only adjust every adjustment_interval hours
         if current_time - self.last_adjustment_time < self.adjustment_interval * 3600:
             return
             
         # Adjust grid parameters based on volatility and market condition
-        if condition['volatile']:
+        if condition.volatile:
             # Wider grid spacing but fewer levels in volatile markets
-            volatility_factor = min(max(condition['volatility'] / 5, 1), 3)
+            volatility_factor = min(max(condition.volatility / 5, 1), 3)
             self.grid_levels = min(int(10 * volatility_factor), self.max_grid_levels)
             self.grid_step_percent = min(self.max_grid_step, 0.65 * volatility_factor)
             
@@ -1605,14 +1799,14 @@ class SOLFuturesGridStrategy(TradingStrategy):
             
             logger.info(f"SOL Strategy: Adjusted for volatile market. Grid levels={self.grid_levels}, step={self.grid_step_percent:.2f}%")
             
-        elif condition['trending']:
-            trend_dir = condition['trend_direction']
+        elif condition.trending:
+            trend_dir = condition.trend_direction
             
             # Adjust based on trend direction and strength
             if trend_dir > 0:  # Uptrend
                 # In uptrend, use fewer grid levels but wider spacing
                 self.grid_levels = max(int(self.min_grid_levels * 1.5), 12)
-                self.grid_step_percent = min(0.8, 0.6 + condition['adx'] / 100)
+                self.grid_step_percent = min(0.8, 0.6 + condition.adx / 100)
                 
                 # Adjust RSI for uptrend bias
                 self.rsi_overbought = 75
@@ -1625,7 +1819,7 @@ class SOLFuturesGridStrategy(TradingStrategy):
             else:  # Downtrend
                 # In downtrend, use more grid levels with tighter spacing
                 self.grid_levels = max(int(self.min_grid_levels * 1.5), 12)
-                self.grid_step_percent = min(0.8, 0.6 + condition['adx'] / 100)
+                self.grid_step_percent = min(0.8, 0.6 + condition.adx / 100)
                 
                 # Adjust RSI for downtrend bias
                 self.rsi_overbought = 65
@@ -1642,9 +1836,9 @@ class SOLFuturesGridStrategy(TradingStrategy):
             
             logger.info(f"SOL Strategy: Adjusted for trending market ({trend_dir}). Grid levels={self.grid_levels}, step={self.grid_step_percent:.2f}%")
             
-        elif condition['ranging']:
+        elif condition.ranging:
             # More grid levels with tighter spacing in ranging markets
-            range_volatility = condition['volatility'] / 2
+            range_volatility = condition.volatility / 2
             self.grid_levels = max(20, int(25 - range_volatility))
             self.grid_step_percent = max(self.min_grid_step, 0.35 + range_volatility * 0.05)
             
@@ -1695,10 +1889,12 @@ class SOLFuturesGridStrategy(TradingStrategy):
     def optimize_from_results(self):
         """Auto-optimize parameters based on trade results"""
         # Skip if not enough trades
-        if self.trade_results['wins'] + self.trade_results['losses'] < 10:
+        stats = self.trade_results
+        trades = stats.wins + stats.losses
+        if trades < 10:
             return
             
-        win_rate = self.trade_results['wins'] / (self.trade_results['wins'] + self.trade_results['losses'])
+        win_rate = stats.wins / trades
         
         # Adjust grid parameters based on win rate
         if win_rate < 0.4:  # Poor performance
@@ -1713,19 +1909,34 @@ class SOLFuturesGridStrategy(TradingStrategy):
             logger.info(f"SOL Strategy: Auto-optimization adjusted parameters due to high win rate ({win_rate:.2f})")
         
         # Reset trade results for next period
-        self.trade_results = {'wins': 0, 'losses': 0, 'profit': 0, 'drawdown': 0}
+        self.trade_results = _TradeStats()
     
     def update_trade_result(self, result):
         """Update trade results for optimization"""
-        if result['profit'] > 0:
-            self.trade_results['wins'] += 1
-            self.trade_results['profit'] += result['profit']
+        stats = self.trade_results
+        profit = result['profit']
+        if profit > 0:
+            stats.wins += 1
+            stats.profit += profit
         else:
-            self.trade_results['losses'] += 1
-            self.trade_results['drawdown'] = min(self.trade_results['drawdown'], result['profit'])
+            stats.losses += 1
+            stats.drawdown = min(stats.drawdown, profit)
     
     def get_signal(self, klines):
         """Get trading signal based on current market conditions"""
+        # Polling within the same candle gives the same answer - skip the indicator pipeline
+        fingerprint = self._klines_fingerprint(klines)
+        if self._sig_cache is not None and self._sig_cache[:2] == (fingerprint, self._signal_params()):
+            return self._sig_cache[2]
+        
+        signal = self._calculate_signal(klines)
+        
+        # Key on the parameters after the call since adjust_parameters may have changed them
+        self._sig_cache = (fingerprint, self._signal_params(), signal)
+        return signal
+    
+    def _calculate_signal(self, klines):
+        """Calculate trading signal from scratch"""
         # Convert klines to dataframe
         df = self.prepare_data(klines)
         
@@ -1734,120 +1945,113 @@ class SOLFuturesGridStrategy(TradingStrategy):
             logger.warning(f"SOL FuturesGrid: Not enough data to generate signal ({len(df)} candles)")
             return None
         
-        # Detect market condition
+        # Detect market condition - needed every bar since the signal rules branch on it
         condition = self.detect_market_condition(df)
         
-        # Dynamically adjust parameters based on market conditions
-        self.adjust_parameters(df, condition)
+        # Dynamically adjust parameters based on market conditions, only once the recalibration interval has passed
+        if time.monotonic() - self.last_adjustment_time >= self.adjustment_interval * 3600:
+            self.adjust_parameters(df, condition)
         
-        # Use safe window periods based on available data
-        ema_short = min(self.ema_short, len(df)//2)
-        ema_medium = min(self.ema_medium, len(df)//2)
-        ema_long = min(self.ema_long, len(df)//2)
+        # Use safe window periods based on available data - at most half the history
+        half = len(df) // 2
         
-        if ema_short < 2: ema_short = 2
-        if ema_medium < 3: ema_medium = 3
-        if ema_long < 5: ema_long = 5
+        ema_short = max(min(self.ema_short, half), 2)
+        ema_medium = max(min(self.ema_medium, half), 3)
+        ema_long = max(min(self.ema_long, half), 5)
+        
+        atr_period = max(min(self.atr_period, half), 2)
+        bb_period = max(min(self.bb_period, half), 2)
+        rsi_period = max(min(self.rsi_period, half), 2)
+        stoch_k = max(min(self.stoch_k, half), 2)
+        stoch_d = max(min(self.stoch_d, half), 2)
+        vwap_window = max(min(self.vwap_window, half), 2)
+        
+        close = df['close'].to_numpy()
+        high = df['high'].to_numpy()
+        low = df['low'].to_numpy()
+        volume = df['volume'].to_numpy()
+        
+        # Indicator arrays - only the last two values are read, so they never go into df
+        arrs = {'close': close}
         
         # Calculate indicators with proper error handling
         try:
-            # Calculate EMAs for trend identification
-            df['ema_short'] = ta.trend.EMAIndicator(
-                close=df['close'], 
-                window=ema_short
-            ).ema_indicator()
-            
-            df['ema_medium'] = ta.trend.EMAIndicator(
-                close=df['close'], 
-                window=ema_medium
-            ).ema_indicator()
-            
-            df['ema_long'] = ta.trend.EMAIndicator(
-                close=df['close'], 
-                window=ema_long
-            ).ema_indicator()
-            
-            # Calculate ATR for volatility assessment - safe period
-            atr_period = min(self.atr_period, len(df)//2)
-            if atr_period < 2: atr_period = 2
-            
-            df['atr'] = ta.volatility.AverageTrueRange(
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                window=atr_period
-            ).average_true_range()
-            
-            # Calculate normalized ATR (%)
-            df['n_atr'] = (df['atr'] / df['close']) * 100
-            
-            # Calculate Bollinger Bands for dynamic grid - safe period
-            bb_period = min(self.bb_period, len(df)//2)
-            if bb_period < 2: bb_period = 2
-            
-            bb_indicator = ta.volatility.BollingerBands(
-                close=df['close'],
-                window=bb_period,
-                window_dev=self.bb_std
-            )
-            df['bb_high'] = bb_indicator.bollinger_hband()
-            df['bb_low'] = bb_indicator.bollinger_lband()
-            df['bb_mid'] = bb_indicator.bollinger_mavg()
-            df['bb_width'] = (df['bb_high'] - df['bb_low']) / df['bb_mid']
-            
-            # Calculate RSI for momentum - safe period
-            rsi_period = min(self.rsi_period, len(df)//2)
-            if rsi_period < 2: rsi_period = 2
-            
-            df['rsi'] = ta.momentum.RSIIndicator(
-                close=df['close'], 
-                window=rsi_period
-            ).rsi()
-            
-            # Calculate Stochastic for momentum - safe periods
-            stoch_k = min(self.stoch_k, len(df)//2)
-            stoch_d = min(self.stoch_d, len(df)//2)
-            
-            if stoch_k < 2: stoch_k = 2
-            if stoch_d < 2: stoch_d = 2
-            
-            stoch = ta.momentum.StochasticOscillator(
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                window=stoch_k,
-                smooth_window=stoch_d
-            )
-            df['stoch_k'] = stoch.stoch()
-            df['stoch_d'] = stoch.stoch_signal()
+            if HAS_NUMBA:
+                # EMAs, ATR, Bollinger Bands, RSI and Stochastic in one pass over the bars, in float64
+                # so the values match the ta fallback below
+                (arrs['ema_short'], arrs['ema_medium'], arrs['ema_long'], arrs['atr'],
+                 arrs['bb_high'], arrs['bb_mid'], arrs['bb_low'], arrs['rsi'],
+                 arrs['stoch_k'], arrs['stoch_d']) = grid_indicators(
+                    close, high, low,
+                    ema_short, ema_medium, ema_long, atr_period,
+                    bb_period, self.bb_std, rsi_period, stoch_k, stoch_d
+                )
+            else:
+                # Calculate EMAs for trend identification
+                arrs['ema_short'] = ta.trend.EMAIndicator(
+                    close=df['close'], 
+                    window=ema_short
+                ).ema_indicator().to_numpy()
+                
+                arrs['ema_medium'] = ta.trend.EMAIndicator(
+                    close=df['close'], 
+                    window=ema_medium
+                ).ema_indicator().to_numpy()
+                
+                arrs['ema_long'] = ta.trend.EMAIndicator(
+                    close=df['close'], 
+                    window=ema_long
+                ).ema_indicator().to_numpy()
+                
+                # Calculate ATR for volatility assessment
+                arrs['atr'] = ta.volatility.AverageTrueRange(
+                    high=df['high'],
+                    low=df['low'],
+                    close=df['close'],
+                    window=atr_period
+                ).average_true_range().to_numpy()
+                
+                # Calculate Bollinger Bands for dynamic grid - only the last two bars are read,
+                # so take the mean and population deviation of just their two windows
+                bb_windows = sliding_window_view(close[-(bb_period + 1):], bb_period)
+                arrs['bb_mid'] = bb_windows.mean(axis=1)
+                bb_deviation = self.bb_std * bb_windows.std(axis=1)
+                arrs['bb_high'] = arrs['bb_mid'] + bb_deviation
+                arrs['bb_low'] = arrs['bb_mid'] - bb_deviation
+                
+                # Calculate RSI for momentum
+                arrs['rsi'] = ta.momentum.RSIIndicator(
+                    close=df['close'], 
+                    window=rsi_period
+                ).rsi().to_numpy()
+                
+                # Calculate Stochastic for momentum
+                stoch = ta.momentum.StochasticOscillator(
+                    high=df['high'],
+                    low=df['low'],
+                    close=df['close'],
+                    window=stoch_k,
+                    smooth_window=stoch_d
+                )
+                arrs['stoch_k'] = stoch.stoch().to_numpy()
+                arrs['stoch_d'] = stoch.stoch_signal().to_numpy()
             
             # Order flow approximation using volume delta
-            df['volume_delta'] = df.apply(
-                lambda x: x['volume'] if x['close'] > x['open'] else -x['volume'], 
-                axis=1
-            )
+            volume_delta = np.where(close > df['open'].to_numpy(), volume, -volume)
             
-            # Safe window for rolling operations
-            vwap_window = min(self.vwap_window, len(df)//2)
-            if vwap_window < 2: vwap_window = 2
+            arrs['cum_delta'] = rolling_sum(volume_delta, vwap_window)
             
-            df['cum_delta'] = df['volume_delta'].rolling(window=vwap_window).sum()
-            df['obv'] = ta.volume.OnBalanceVolumeIndicator(
-                close=df['close'],
-                volume=df['volume']
-            ).on_balance_volume()
+            # On-balance volume - the first bar counts as an up bar
+            arrs['obv'] = np.cumsum(np.where(np.diff(close, prepend=close[0]) < 0, -volume, volume))
             
             # Calculate VWAP (approximation)
-            df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
-            df['tp_volume'] = df['typical_price'] * df['volume']
-            df['cum_tp_volume'] = df['tp_volume'].rolling(window=vwap_window).sum()
-            df['cum_volume'] = df['volume'].rolling(window=vwap_window).sum()
-            
-            # Handle potential division by zero
-            df['vwap'] = df.apply(
-                lambda x: x['cum_tp_volume'] / x['cum_volume'] if x['cum_volume'] > 0 else x['close'],
-                axis=1
-            )
+            typical_price = (high + low + close) / 3
+            cum_tp_volume = rolling_sum(typical_price * volume, vwap_window)
+            cum_volume = rolling_sum(volume, vwap_window)
+            
+            # Handle potential division by zero (and the NaN warm-up rows) by falling back to close
+            has_volume = cum_volume > 0
+            arrs['vwap'] = np.where(has_volume, cum_tp_volume / np.where(has_volume, cum_volume, 1), close)
             
         except Exception as e:
             logger.warning(f"Error calculating indicators: {e}")
@@ -1856,7 +2060,7 @@ class SOLFuturesGridStrategy(TradingStrategy):
         # Check for NaN values in key indicators
         key_indicators = ['ema_short', 'ema_medium', 'bb_high', 'bb_low', 'rsi', 'stoch_k', 'vwap']
         for indicator in key_indicators:
-            if indicator in df.columns and (df[indicator].isna().iloc[-1] or df[indicator].isna().iloc[-2]):
+            if np.isnan(arrs[indicator][-2:]).any():
                 logger.warning(f"SOL FuturesGrid: NaN value in {indicator}, skipping signal generation")
                 return None
                 
@@ -1867,195 +2071,214 @@ class SOLFuturesGridStrategy(TradingStrategy):
             
         # Safe extraction of current and previous values
         try:
-            # Current values
-            current_price = df['close'].iloc[-1]
-            current_ema_short = df['ema_short'].iloc[-1]
-            current_ema_medium = df['ema_medium'].iloc[-1]
-            current_ema_long = df['ema_long'].iloc[-1]
-            current_atr = df['atr'].iloc[-1]
-            current_n_atr = df['n_atr'].iloc[-1]
-            current_bb_high = df['bb_high'].iloc[-1]
-            current_bb_low = df['bb_low'].iloc[-1]
-            current_bb_mid = df['bb_mid'].iloc[-1]
-            current_bb_width = df['bb_width'].iloc[-1]
-            current_rsi = df['rsi'].iloc[-1]
-            current_stoch_k = df['stoch_k'].iloc[-1]
-            current_stoch_d = df['stoch_d'].iloc[-1]
-            current_cum_delta = df['cum_delta'].iloc[-1]
-            current_obv = df['obv'].iloc[-1]
-            current_vwap = df['vwap'].iloc[-1]
-            
-            # Previous values
-            prev_price = df['close'].iloc[-2]
-            prev_ema_short = df['ema_short'].iloc[-2]
-            prev_ema_medium = df['ema_medium'].iloc[-2]
-            prev_rsi = df['rsi'].iloc[-2]
-            prev_stoch_k = df['stoch_k'].iloc[-2]
-            prev_stoch_d = df['stoch_d'].iloc[-2]
-            prev_cum_delta = df['cum_delta'].iloc[-2]
-            prev_obv = df['obv'].iloc[-2]
+            # Snapshot the last two values of every indicator the signal logic reads into two records
+            snap = np.empty(2, dtype=_SNAPSHOT_DTYPE)
+            for name in _SNAPSHOT_COLUMNS:
+                snap[name] = arrs[name][-2:]
+            
+            # Current and previous values by indicator name
+            prev, cur = snap
         except Exception as e:
             logger.warning(f"Error extracting indicator values: {e}")
             return None
         
-        # Calculate volatility-adjusted grid levels
-        # Higher volatility = wider grid steps
-        volatility_factor = min(max(current_n_atr / 2, 0.4), 1.5)  # Constrain volatility factor
-        grid_range = current_bb_high - current_bb_low
-        
-        # Market condition assessment
-        trend_strength = abs(current_ema_medium - current_ema_long) / max(current_atr, 0.0001)  # Avoid division by zero
-        is_strong_trend = trend_strength > 1.5
-        is_uptrend = current_ema_short > current_ema_medium > current_ema_long
-        is_downtrend = current_ema_short < current_ema_medium < current_ema_long
+        # Condition code, checked in the order trending, ranging, volatile - indexes the handlers and names
+        regime = (_TRENDING if condition.trending else _RANGING if condition.ranging
+                  else _VOLATILE if condition.volatile else _NORMAL)
         
         # Signal logic with dynamic adjustment based on market conditions
+        buy_signal, sell_signal, reason = self._SIGNAL_HANDLERS[regime](self, condition, cur, prev)
+        
+        # Generate signals
+        if buy_signal:
+            logger.info(f"SOL FuturesGrid: BUY signal - {reason} [Condition: {_CONDITION_NAMES[regime]}]")
+            return "BUY"
+        elif sell_signal:
+            logger.info(f"SOL FuturesGrid: SELL signal - {reason} [Condition: {_CONDITION_NAMES[regime]}]")
+            return "SELL"
+            
+        return None
+    
+    def _normal_signal(self, condition, cur, prev):
+        """Grid trading at the band edges confirmed by order flow - returns (buy, sell, reason)"""
         buy_signal = False
         sell_signal = False
         reason = ""
+        grid_range = cur['bb_high'] - cur['bb_low']
         
-        # Adjust signal logic based on detected market condition
-        if condition['trending']:
-            if condition['trend_direction'] > 0:  # Uptrend
-                # BUY conditions for uptrend - buy pullbacks
-                if (current_price < current_ema_medium and 
-                    current_price > current_ema_long and
-                    current_rsi < 50 and current_rsi > prev_rsi):
-                    if current_stoch_k < 40 and current_stoch_k > current_stoch_d:
-                        buy_signal = True
-                        reason = "Buying pullback in uptrend with stochastic confirmation"
-                
-                # SELL conditions for uptrend - take profits at resistance
-                if (current_price > current_bb_high * 0.98 and
-                    current_stoch_k > 80 and current_stoch_k < current_stoch_d):
-                    sell_signal = True
-                    reason = "Taking profit at resistance in uptrend"
-                    
-            else:  # Downtrend
-                # BUY conditions for downtrend - only strong reversal signals
-                if (current_price < current_bb_low * 1.02 and
-                    current_price > prev_price and
-                    current_rsi < 30 and current_rsi > prev_rsi and
-                    current_obv > prev_obv):
+        # Default BUY conditions for normal market
+        grid_buy_level = cur['bb_low'] + (grid_range * 0.2)
+        if cur['close'] <= grid_buy_level:
+            if cur['cum_delta'] > prev['cum_delta'] and cur['obv'] > prev['obv']:
+                if cur['rsi'] < 40 and cur['rsi'] > prev['rsi']:
                     buy_signal = True
-                    reason = "Potential reversal signal in downtrend"
-                
-                # SELL conditions for downtrend - sell rallies
-                if (current_price > current_vwap and
-                    current_price < current_bb_mid and
-                    current_ema_short < current_ema_medium and
-                    current_stoch_k > 60 and current_stoch_k < current_stoch_d):
+                    reason = "Grid buy at support with positive order flow"
+        
+        # Default SELL conditions for normal market
+        grid_sell_level = cur['bb_high'] - (grid_range * 0.2)
+        if cur['close'] >= grid_sell_level:
+            if cur['cum_delta'] < prev['cum_delta'] and cur['obv'] < prev['obv']:
+                if cur['rsi'] > 60 and cur['rsi'] < prev['rsi']:
                     sell_signal = True
-                    reason = "Selling rally in downtrend"
-                    
-        elif condition['ranging']:
-            # BUY conditions for ranging market - buy near support with positive order flow
-            grid_buy_level = current_bb_low + (grid_range * 0.15)  # Lower 15% of range
-            if current_price <= grid_buy_level:
-                if current_cum_delta > prev_cum_delta:
-                    if current_rsi < self.rsi_oversold + 10 and current_rsi > prev_rsi:
-                        buy_signal = True
-                        reason = "Range trading buy at support with positive flow"
-            
-            # SELL conditions for ranging market - sell near resistance with negative order flow
-            grid_sell_level = current_bb_high - (grid_range * 0.15)  # Upper 15% of range
-            if current_price >= grid_sell_level:
-                if current_cum_delta < prev_cum_delta:
-                    if current_rsi > self.rsi_overbought - 10 and current_rsi < prev_rsi:
-                        sell_signal = True
-                        reason = "Range trading sell at resistance with negative flow"
-                        
-        elif condition['volatile']:
-            # BUY conditions for volatile market - more confirmations required
-            if (current_ema_short > current_ema_medium and prev_ema_short <= prev_ema_medium):
-                if (current_price > current_vwap and 
-                    current_obv > prev_obv and 
-                    current_cum_delta > prev_cum_delta):
+                    reason = "Grid sell at resistance with negative order flow"
+        
+        return buy_signal, sell_signal, reason
+    
+    def _trending_signal(self, condition, cur, prev):
+        """Buy pullbacks in uptrends and sell rallies in downtrends - returns (buy, sell, reason)"""
+        buy_signal = False
+        sell_signal = False
+        reason = ""
+        
+        if condition.trend_direction > 0:  # Uptrend
+            # BUY conditions for uptrend - buy pullbacks
+            if (cur['close'] < cur['ema_medium'] and 
+                cur['close'] > cur['ema_long'] and
+                cur['rsi'] < 50 and cur['rsi'] > prev['rsi']):
+                if cur['stoch_k'] < 40 and cur['stoch_k'] > cur['stoch_d']:
                     buy_signal = True
-                    reason = "EMA cross with multiple confirmations in volatile market"
+                    reason = "Buying pullback in uptrend with stochastic confirmation"
             
-            # SELL conditions for volatile market - quicker exit
-            if (current_ema_short < current_ema_medium and prev_ema_short >= prev_ema_medium):
-                if (current_price < current_vwap or 
-                    current_obv < prev_obv):
+            # SELL conditions for uptrend - take profits at resistance
+            if (cur['close'] > cur['bb_high'] * 0.98 and
+                cur['stoch_k'] > 80 and cur['stoch_k'] < cur['stoch_d']):
+                sell_signal = True
+                reason = "Taking profit at resistance in uptrend"
+                
+        else:  # Downtrend
+            # BUY conditions for downtrend - only strong reversal signals
+            if (cur['close'] < cur['bb_low'] * 1.02 and
+                cur['close'] > prev['close'] and
+                cur['rsi'] < 30 and cur['rsi'] > prev['rsi'] and
+                cur['obv'] > prev['obv']):
+                buy_signal = True
+                reason = "Potential reversal signal in downtrend"
+            
+            # SELL conditions for downtrend - sell rallies
+            if (cur['close'] > cur['vwap'] and
+                cur['close'] < cur['bb_mid'] and
+                cur['ema_short'] < cur['ema_medium'] and
+                cur['stoch_k'] > 60 and cur['stoch_k'] < cur['stoch_d']):
+                sell_signal = True
+                reason = "Selling rally in downtrend"
+        
+        return buy_signal, sell_signal, reason
+    
+    def _ranging_signal(self, condition, cur, prev):
+        """Range trading near the band edges with order flow - returns (buy, sell, reason)"""
+        buy_signal = False
+        sell_signal = False
+        reason = ""
+        grid_range = cur['bb_high'] - cur['bb_low']
+        
+        # BUY conditions for ranging market - buy near support with positive order flow
+        grid_buy_level = cur['bb_low'] + (grid_range * 0.15)  # Lower 15% of range
+        if cur['close'] <= grid_buy_level:
+            if cur['cum_delta'] > prev['cum_delta']:
+                if cur['rsi'] < self.rsi_oversold + 10 and cur['rsi'] > prev['rsi']:
+                    buy_signal = True
+                    reason = "Range trading buy at support with positive flow"
+        
+        # SELL conditions for ranging market - sell near resistance with negative order flow
+        grid_sell_level = cur['bb_high'] - (grid_range * 0.15)  # Upper 15% of range
+        if cur['close'] >= grid_sell_level:
+            if cur['cum_delta'] < prev['cum_delta']:
+                if cur['rsi'] > self.rsi_overbought - 10 and cur['rsi'] < prev['rsi']:
                     sell_signal = True
-                    reason = "Quick exit on EMA cross in volatile market"
-                    
-        else:
-            # Default BUY conditions for normal market
-            grid_buy_level = current_bb_low + (grid_range * 0.2)
-            if current_price <= grid_buy_level:
-                if current_cum_delta > prev_cum_delta and current_obv > prev_obv:
-                    if current_rsi < 40 and current_rsi > prev_rsi:
-                        buy_signal = True
-                        reason = "Grid buy at support with positive order flow"
-            
-            # Default SELL conditions for normal market
-            grid_sell_level = current_bb_high - (grid_range * 0.2)
-            if current_price >= grid_sell_level:
-                if current_cum_delta < prev_cum_delta and current_obv < prev_obv:
-                    if current_rsi > 60 and current_rsi < prev_rsi:
-                        sell_signal = True
-                        reason = "Grid sell at resistance with negative order flow"
+                    reason = "Range trading sell at resistance with negative flow"
         
-        # Generate signals
-        if buy_signal:
-            logger.info(f"SOL FuturesGrid: BUY signal - {reason} [Condition: {'Trending' if condition['trending'] else 'Ranging' if condition['ranging'] else 'Volatile' if condition['volatile'] else 'Normal'}]")
-            return "BUY"
-        elif sell_signal:
-            logger.info(f"SOL FuturesGrid: SELL signal - {reason} [Condition: {'Trending' if condition['trending'] else 'Ranging' if condition['ranging'] else 'Volatile' if condition['volatile'] else 'Normal'}]")
-            return "SELL"
-            
-        return None
+        return buy_signal, sell_signal, reason
+    
+    def _volatile_signal(self, condition, cur, prev):
+        """EMA crosses with extra confirmation, exiting quickly - returns (buy, sell, reason)"""
+        buy_signal = False
+        sell_signal = False
+        reason = ""
+        
+        # BUY conditions for volatile market - more confirmations required
+        if (cur['ema_short'] > cur['ema_medium'] and prev['ema_short'] <= prev['ema_medium']):
+            if (cur['close'] > cur['vwap'] and 
+                cur['obv'] > prev['obv'] and 
+                cur['cum_delta'] > prev['cum_delta']):
+                buy_signal = True
+                reason = "EMA cross with multiple confirmations in volatile market"
+        
+        # SELL conditions for volatile market - quicker exit
+        if (cur['ema_short'] < cur['ema_medium'] and prev['ema_short'] >= prev['ema_medium']):
+            if (cur['close'] < cur['vwap'] or 
+                cur['obv'] < prev['obv']):
+                sell_signal = True
+                reason = "Quick exit on EMA cross in volatile market"
+        
+        return buy_signal, sell_signal, reason
+    
+    # Signal handlers indexed by condition code
+    _SIGNAL_HANDLERS = (_normal_signal, _trending_signal, _ranging_signal, _volatile_signal)
 
 
-# Update the strategy factory to include the new strategies
-def get_strategy(strategy_name):
-    """Factory function to get a strategy by name"""
-    strategies = {
-        'BTC_Scalping': BTCScalpingStrategy(),
-        'ETH_StochMACD': ETHStochMACD(),
-        'BNB_Grid': BNBGridStrategy(),
-        'SOL_Squeeze': SOLSqueezeStrategy(),
-        'ADA_EMATrend': ADAEMATrendStrategy(),
-        'XRP_Scalping': XRPScalpingStrategy(),
-        'DOGE_Scalping': DOGEScalpingStrategy(),
-        'SHIB_Breakout': SHIBBreakoutStrategy(),
-        'XRP_FuturesGrid': XRPFuturesGridStrategy(),
-        'SOL_FuturesGrid': SOLFuturesGridStrategy(),
-    }
-    
-    if strategy_name in strategies:
-        return strategies[strategy_name]
+# Strategy classes by name - instances are only created for the strategy that is asked for
+_STRATEGY_CLASSES = {
+    'BTC_Scalping': BTCScalpingStrategy,
+    'ETH_StochMACD': ETHStochMACD,
+    'BNB_Grid': BNBGridStrategy,
+    'SOL_Squeeze': SOLSqueezeStrategy,
+    'ADA_EMATrend': ADAEMATrendStrategy,
+    'XRP_Scalping': XRPScalpingStrategy,
+    'DOGE_Scalping': DOGEScalpingStrategy,
+    'SHIB_Breakout': SHIBBreakoutStrategy,
+    'XRP_FuturesGrid': XRPFuturesGridStrategy,
+    'SOL_FuturesGrid': SOLFuturesGridStrategy,
+}
+
+
+def create_strategy(strategy_name):
+    """Create a new, independent strategy instance by name"""
+    if strategy_name in _STRATEGY_CLASSES:
+        return _STRATEGY_CLASSES[strategy_name]()
     else:
         logger.warning(f"Strategy {strategy_name} not found. Using default ETH_StochMACD strategy.")
-        return strategies['ETH_StochMACD']
+        return ETHStochMACD()
+
+
+def get_strategy(strategy_name):
+    """Factory function to get a new strategy instance by name"""
+    return create_strategy(strategy_name)
 
 
 def get_strategy_for_symbol(symbol, strategy_name=None):
-    """Get the appropriate strategy based on the trading symbol"""
-    # If a specific strategy is requested, use it
-    if strategy_name:
-        return get_strategy(strategy_name)
-    
-    # Otherwise, map symbols to optimized strategies
+    """
+    Get the appropriate strategy based on the trading symbol
+    Strategies are stateful (parameter adjustments, signal and indicator caches), so each
+    symbol gets its own instance, reused on later calls for the same symbol and strategy
+    """
     symbol = symbol.upper()
+    return _strategy_for_symbol(symbol, strategy_name or _default_strategy_name(symbol))
+
+
+@lru_cache(maxsize=None)
+def _strategy_for_symbol(symbol, strategy_name):
+    """One strategy instance per (symbol, strategy name)"""
+    return create_strategy(strategy_name)
+
+
+def _default_strategy_name(symbol):
+    """Map a symbol to its optimized strategy"""
     if 'BTCUSDT' in symbol:
-        return BTCScalpingStrategy()
+        return 'BTC_Scalping'
     elif 'ETHUSDT' in symbol:
-        return ETHStochMACD()
+        return 'ETH_StochMACD'
     elif 'BNBUSDT' in symbol:
-        return BNBGridStrategy()
+        return 'BNB_Grid'
     elif 'SOLUSDT' in symbol:
-        return SOLFuturesGridStrategy()  # Updated to use the new SOL strategy
+        return 'SOL_FuturesGrid'  # Updated to use the new SOL strategy
     elif 'ADAUSDT' in symbol:
-        return ADAEMATrendStrategy()
+        return 'ADA_EMATrend'
     elif 'XRPUSDT' in symbol:
-        return XRPFuturesGridStrategy()  # Updated to use the new XRP strategy
+        return 'XRP_FuturesGrid'  # Updated to use the new XRP strategy
     elif 'DOGEUSDT' in symbol:
-        return DOGEScalpingStrategy()
+        return 'DOGE_Scalping'
     elif 'SHIBUSDT' in symbol:
-        return SHIBBreakoutStrategy()
+        return 'SHIB_Breakout'
     else:
         # Default to ETH_StochMACD for other tokens as a reasonable choice
-        return ETHStochMACD()
\ No newline at end of file
+        return 'ETH_StochMACD'
@@ -1,42 +1,140 @@
+import functools
 import json
 import logging
+import queue
 import threading
 import time
-from typing import Dict, Callable, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Callable, Any, Optional, List, NamedTuple, Union
+import requests
 import websocket
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 
 from modules.config import (
     TRADING_SYMBOL, TIMEFRAME, API_KEY, API_SECRET, 
-    RETRY_COUNT, RETRY_DELAY, API_URL, RECV_WINDOW,
+    RETRY_DELAY, API_URL, 
     API_TESTNET, WS_BASE_URL
 )
 
 logger = logging.getLogger(__name__)
 
+# orjson parses frames several times faster than the stdlib; fall back to json when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Listen key requests share one pooled keep-alive connection instead of a new TLS handshake each time
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+if API_KEY:
+    _http.headers.update({"X-MBX-APIKEY": API_KEY})
+
+class KlineSnapshot(NamedTuple):
+    """
+    Latest kline for a symbol; immutable, a new snapshot replaces the old one on every kline message
+    Supports dict-style reads (snapshot['close'], snapshot.get('close')) for existing callers
+    """
+    open_time: Optional[int]
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    close_time: Optional[int]
+    is_closed: bool
+    
+    def __getitem__(self, key):
+        if not isinstance(key, str):
+            return tuple.__getitem__(self, key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key, default=None):
+        """Return a field by name, or default if it is unknown"""
+        return getattr(self, key, default)
+
 class BinanceWebSocketManager:
     """
     WebSocket Manager for real-time Binance data
     Handles kline (candlestick) and user data WebSocket streams
     """
     
+    # Fixed attribute layout: no per-instance __dict__ and faster attribute access on the message path
+    __slots__ = (
+        'ws', 'ws_user', 'running', 'symbols', '_symbols_lower', '_symbols_snapshot',
+        'callbacks', '_subscriptions', '_cb_kline', '_cb_kline_update', '_cb_trade', '_cb_book_ticker',
+        '_cb_account_update', '_cb_order_update', '_cb_margin_call',
+        'listen_key', 'last_listen_key_update', 'user_stream_connected',
+        '_shutdown', '_user_reconnect_evt', '_in_q', '_dropped_messages', 'timeframe_mapping', 'last_kline_data', '_market_stream_url',
+        '_stream_dispatch', '_user_dispatch', '_parse_pool',
+        'ws_thread', 'processor_thread', 'user_ws_thread', 'keep_alive_thread'
+    )
+    
     # Use dynamic WebSocket URLs based on testnet setting
     BINANCE_WS_URL = f"{WS_BASE_URL}/ws"
     BINANCE_COMBINED_STREAM_URL = f"{WS_BASE_URL}/stream?streams="
     
+    # Frames go straight to the JSON parser, which validates UTF-8 itself; the library's
+    # heartbeat pings every 3 minutes and drops the connection if no pong comes back in 30s,
+    # and it reconnects on its own RETRY_DELAY seconds after a dropped connection or a server
+    # close frame (websocket-client >= 1.9.2, see requirements.txt); the stream threads still
+    # loop in case run_forever returns while the manager is running
+    RUN_FOREVER_OPTIONS = {
+        'reconnect': RETRY_DELAY,
+        'skip_utf8_validation': True,
+        'ping_interval': 180,
+        'ping_timeout': 30
+    }
+    
+    # Optional market streams by the data type that consumes them; klines are always streamed
+    # because get_last_kline serves the latest price
+    OPTIONAL_STREAMS = {
+        'trade': 'trade',
+        'book_ticker': 'bookTicker'
+    }
+    
+    # Maximum number of queued market frames handled per wake-up of the processor thread
+    MESSAGE_BATCH_SIZE = 128
+    
+    # Upper bound on queued market frames; when the processor falls behind the oldest frames are dropped
+    MAX_QUEUED_MESSAGES = 10000
+    
     def __init__(self):
         self.ws = None
         self.ws_user = None
         self.running = False
         self.symbols = []  # List of symbols to track
+        self._symbols_lower = set()  # Lowercased symbols for constant-time membership checks
+        self._symbols_snapshot = ()  # Immutable copy of symbols, rebuilt only when they change
         self.callbacks = {}  # Callbacks for different data types
+        self._subscriptions = set()  # Optional data types requested via subscribe()
+        
+        # Registered callbacks mirrored as attributes so message processing skips the dict lookups
+        self._cb_kline = None
+        self._cb_kline_update = None
+        self._cb_trade = None
+        self._cb_book_ticker = None
+        self._cb_account_update = None
+        self._cb_order_update = None
+        self._cb_margin_call = None
         self.listen_key = None
         self.last_listen_key_update = None
         self.user_stream_connected = False
         
-        # Lock for controlling reconnection attempts
-        self.reconnect_lock = threading.Lock()
-        self.is_reconnecting = False
+        # Set by stop() so waiting background threads exit immediately; replaced on each start()
+        self._shutdown = threading.Event()
+        
+        # Set to make the user stream supervisor reconnect once the current socket closes
+        self._user_reconnect_evt = threading.Event()
+        
+        # Raw market frames handed from the WebSocket thread to the processor thread; replaced on each start()
+        self._in_q = queue.Queue(maxsize=self.MAX_QUEUED_MESSAGES)
+        self._dropped_messages = 0
         
         # Show testnet info if using testnet
         if API_TESTNET:
@@ -51,18 +149,45 @@ class BinanceWebSocketManager:
         }
         
         # Store last received kline data
-        self.last_kline_data = {}
+        self.last_kline_data: Dict[str, KlineSnapshot] = {}
+        
+        # Combined stream URL for the tracked symbols, built on first connect and reused on reconnects
+        self._market_stream_url = None
+        
+        # Market data handlers by stream type - the part of the stream name after '@', e.g. kline_15m -> kline
+        self._stream_dispatch = {
+            'kline': self._process_kline_data,
+            'trade': self._process_trade_data,
+            'bookTicker': self._process_book_ticker_data
+        }
+        
+        # User data handlers by event type
+        self._user_dispatch = {
+            'ACCOUNT_UPDATE': self._process_account_update,
+            'ORDER_TRADE_UPDATE': self._process_order_update,
+            'MARGIN_CALL': self._process_margin_call,
+            'ACCOUNT_CONFIG_UPDATE': self._process_account_config_update,
+            'listenKeyExpired': self._process_listen_key_expired
+        }
+        
+        # Single worker that handles user data events off the socket thread, in the order they arrived;
+        # created by start() and shut down by stop()
+        self._parse_pool = None
         
         # Create threads for WebSocket connections
         self.ws_thread = None
+        self.processor_thread = None
         self.user_ws_thread = None
         self.keep_alive_thread = None
         
     def add_symbol(self, symbol: str):
         """Add a symbol to track via WebSocket"""
         symbol_lower = symbol.lower()
-        if symbol_lower not in [s.lower() for s in self.symbols]:
+        if symbol_lower not in self._symbols_lower:
+            self._symbols_lower.add(symbol_lower)
             self.symbols.append(symbol)
+            self._symbols_snapshot = tuple(self.symbols)
+            self._market_stream_url = None
             logger.info(f"Added {symbol} to WebSocket tracking")
             
             # If already running, reconnect to include new symbol
@@ -72,7 +197,10 @@ class BinanceWebSocketManager:
     def remove_symbol(self, symbol: str):
         """Remove a symbol from WebSocket tracking"""
         symbol_lower = symbol.lower()
+        self._symbols_lower.discard(symbol_lower)
         self.symbols = [s for s in self.symbols if s.lower() != symbol_lower]
+        self._symbols_snapshot = tuple(self.symbols)
+        self._market_stream_url = None
         logger.info(f"Removed {symbol} from WebSocket tracking")
         
         # If already running, reconnect to update symbols
@@ -82,12 +210,37 @@ class BinanceWebSocketManager:
     def register_callback(self, data_type: str, callback: Callable):
         """Register a callback function for specific data type"""
         self.callbacks[data_type] = callback
+        
+        # Mirror known callback types onto their slot for the message handlers
+        attr = f"_cb_{data_type}"
+        if hasattr(type(self), attr):
+            setattr(self, attr, callback)
         logger.debug(f"Registered callback for {data_type}")
         
+        # A callback for an optional stream subscribes to it
+        if data_type in self.OPTIONAL_STREAMS:
+            self.subscribe(data_type)
+    
+    def subscribe(self, *data_types: str):
+        """Stream the given optional data types ('trade', 'book_ticker') even without a callback"""
+        new_types = set(data_types) - self._subscriptions
+        unknown = new_types - self.OPTIONAL_STREAMS.keys()
+        if unknown:
+            logger.warning(f"Ignoring unknown stream types: {', '.join(sorted(unknown))}")
+            new_types -= unknown
+        if not new_types:
+            return
+        
+        self._subscriptions |= new_types
+        self._market_stream_url = None
+        logger.info(f"Subscribed to {', '.join(sorted(new_types))} streams")
+        
+        # If already running, reconnect to include the new streams
+        if self.running:
+            self.reconnect()
+        
     def _get_listen_key(self) -> Optional[str]:
         """Get a listen key for user data stream"""
-        import requests
-        
         if not API_KEY or not API_SECRET:
             logger.warning("API credentials not provided. User data stream unavailable.")
             return None
@@ -97,14 +250,9 @@ class BinanceWebSocketManager:
             base_url = API_URL.rstrip('/')
             url = f"{base_url}/fapi/v1/listenKey"
             
-            headers = {
-                "X-MBX-APIKEY": API_KEY
-            }
-            
-            # For python-binance 1.0.28, we can use proper timeout and headers
-            response = requests.post(
+            # The API key header comes from the shared session
+            response = _http.post(
                 url, 
-                headers=headers, 
                 timeout=10
             )
             
@@ -130,49 +278,23 @@ class BinanceWebSocketManager:
     
     def _keep_listen_key_alive(self):
         """Keep the listen key alive by pinging it periodically"""
-        import requests
-        import hmac
-        import hashlib
+        # Keep the event this thread was started with - start() replaces it for the next run
+        shutdown = self._shutdown
         
         while self.running and self.listen_key:
             try:
-                # Sleep for 30 minutes (keep alive required every 60 mins)
-                time.sleep(30 * 60)
-                
-                if not self.running:
+                # Wait 30 minutes (keep alive required every 60 mins), waking at once on stop()
+                if shutdown.wait(timeout=30 * 60) or not self.running:
                     break
                 
-                # Create timestamp for authentication
-                timestamp = int(time.time() * 1000)
-                
-                # Create signature for Binance API authentication
-                query_string = f"timestamp={timestamp}&recvWindow={RECV_WINDOW}"
-                signature = hmac.new(
-                    API_SECRET.encode('utf-8'),
-                    query_string.encode('utf-8'),
-                    hashlib.sha256
-                ).hexdigest()
-                
                 # Full URL from config instead of hardcoded
                 base_url = API_URL.rstrip('/')
                 url = f"{base_url}/fapi/v1/listenKey"
                 
-                headers = {
-                    "X-MBX-APIKEY": API_KEY,
-                    "Content-Type": "application/json"
-                }
-                
-                params = {
-                    "timestamp": timestamp,
-                    "recvWindow": RECV_WINDOW,
-                    "signature": signature
-                }
-                
-                # Make PUT request with proper timeout to extend listen key validity
-                response = requests.put(
+                # Make PUT request with proper timeout to extend listen key validity;
+                # the endpoint only needs the API key header from the shared session, no signature
+                response = _http.put(
                     url, 
-                    headers=headers, 
-                    params=params, 
                     timeout=10
                 )
                 
@@ -189,13 +311,15 @@ class BinanceWebSocketManager:
             except requests.exceptions.RequestException as e:
                 logger.error(f"Network error refreshing listen key: {e}")
                 # Try to get a new listen key after network error
-                time.sleep(5)  # Short delay to avoid hammering the API
+                if shutdown.wait(timeout=5):  # Short delay to avoid hammering the API
+                    break
                 self.listen_key = self._get_listen_key()
                 if self.listen_key and self.user_stream_connected:
                     self._restart_user_stream()
             except Exception as e:
                 logger.error(f"Error keeping listen key alive: {e}")
-                time.sleep(60)  # Wait before retrying
+                if shutdown.wait(timeout=60):  # Wait before retrying
+                    break
     
     def start(self):
         """Start WebSocket connections"""
@@ -203,9 +327,20 @@ class BinanceWebSocketManager:
             self.add_symbol(TRADING_SYMBOL)
             
         self.running = True
-        
-        # Start market data WebSocket
-        self.ws_thread = threading.Thread(target=self._start_market_stream)
+        self._shutdown = threading.Event()
+        self._user_reconnect_evt = threading.Event()
+        self._in_q = queue.Queue(maxsize=self.MAX_QUEUED_MESSAGES)
+        self._parse_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ws-parse')
+        
+        # Start market data processor so the WebSocket thread only has to enqueue frames
+        self.processor_thread = threading.Thread(target=self._process_market_messages, args=(self._in_q,))
+        self.processor_thread.daemon = True
+        self.processor_thread.start()
+        
+        # Start market data WebSocket. Each stream has its own supervisor thread because
+        # websocket-client's run_forever blocks per socket while handling reconnects and heartbeats;
+        # the threads sleep in select() between frames and message handling runs elsewhere.
+        self.ws_thread = threading.Thread(target=self._supervise_market_stream, args=(self._shutdown, self._in_q))
         self.ws_thread.daemon = True
         self.ws_thread.start()
         
@@ -213,7 +348,10 @@ class BinanceWebSocketManager:
         if API_KEY and API_SECRET:
             self.listen_key = self._get_listen_key()
             if self.listen_key:
-                self.user_ws_thread = threading.Thread(target=self._start_user_stream)
+                self.user_ws_thread = threading.Thread(
+                    target=self._supervise_user_stream,
+                    args=(self._shutdown, self._user_reconnect_evt, self._parse_pool)
+                )
                 self.user_ws_thread.daemon = True
                 self.user_ws_thread.start()
                 
@@ -225,17 +363,27 @@ class BinanceWebSocketManager:
     def stop(self):
         """Stop all WebSocket connections"""
         self.running = False
+        self._shutdown.set()
+        self._user_reconnect_evt.set()  # Wake the user stream supervisor so it exits
+        self._enqueue_market_message(self._in_q, None)  # Wake the processor thread so it exits
         
         # Close market data WebSocket
-        if self.ws:
-            self.ws.close()
-            self.ws = None
+        ws = self.ws
+        self.ws = None
+        if ws is not None:
+            ws.close()
             
         # Close user data WebSocket
-        if self.ws_user:
-            self.ws_user.close()
-            self.ws_user = None
-            self.user_stream_connected = False
+        ws = self.ws_user
+        self.ws_user = None
+        self.user_stream_connected = False
+        if ws is not None:
+            ws.close()
+        
+        # Drop user events still waiting to be handled
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
             
         logger.info("WebSocket connections closed")
     
@@ -245,63 +393,62 @@ class BinanceWebSocketManager:
         time.sleep(1)  # Brief pause before reconnecting
         self.start()
     
-    def _start_market_stream(self):
-        """Start a WebSocket connection for market data"""
-        if not self.symbols:
-            logger.warning("No symbols provided for market data stream")
-            return
+    def _build_market_stream_url(self) -> str:
+        """Build the combined stream URL for all tracked symbols"""
+        timeframe = self.timeframe_mapping.get(TIMEFRAME, '15m')
+        
+        # Only subscribe to the optional streams something consumes
+        suffixes = [f"kline_{timeframe}"]
+        suffixes += [stream for data_type, stream in self.OPTIONAL_STREAMS.items()
+                     if data_type in self._subscriptions]
         
         # Create subscription list for all symbols
         streams = []
         for symbol in self.symbols:
             symbol_lower = symbol.lower()
-            
-            # Add kline stream for each symbol
-            timeframe = self.timeframe_mapping.get(TIMEFRAME, '15m')
-            streams.append(f"{symbol_lower}@kline_{timeframe}")
-            
-            # Add trade stream
-            streams.append(f"{symbol_lower}@trade")
-            
-            # Add book ticker stream for best bid/ask
-            streams.append(f"{symbol_lower}@bookTicker")
+            streams.extend(f"{symbol_lower}@{suffix}" for suffix in suffixes)
         
         # Create combined stream URL
-        stream_url = self.BINANCE_COMBINED_STREAM_URL + "/".join(streams)
+        return self.BINANCE_COMBINED_STREAM_URL + "/".join(streams)
+    
+    def _supervise_market_stream(self, shutdown, in_q):
+        """Run the market data WebSocket, reconnecting whenever it stops, until stop() sets shutdown"""
+        if not self.symbols:
+            logger.warning("No symbols provided for market data stream")
+            return
         
-        # Connect WebSocket with retry logic
-        for attempt in range(RETRY_COUNT):
+        while not shutdown.is_set():
+            # Reuse the combined stream URL unless the tracked symbols changed
+            if self._market_stream_url is None:
+                self._market_stream_url = self._build_market_stream_url()
+            stream_url = self._market_stream_url
+            
+            # Connect WebSocket; run_forever reconnects by itself until the socket is closed
             try:
                 ws_app = websocket.WebSocketApp(
                     stream_url,
-                    on_message=self._on_message,
+                    on_message=functools.partial(self._on_message, in_q),
                     on_error=self._on_error,
                     on_close=self._on_close,
                     on_open=self._on_open
                 )
                 
                 self.ws = ws_app
-                logger.info(f"Starting market data WebSocket connection (attempt {attempt+1})")
-                ws_app.run_forever()
-                
-                # If we reach here, connection closed intentionally or unintentionally
-                if not self.running:
-                    logger.info("Market data WebSocket closed as requested")
-                    break
-                    
-                logger.warning(f"Market data WebSocket connection lost. Reconnecting...")
-                time.sleep(RETRY_DELAY)
-                
+                logger.info("Starting market data WebSocket connection")
+                ws_app.run_forever(**self.RUN_FOREVER_OPTIONS)
             except Exception as e:
                 logger.error(f"Error in market data WebSocket: {e}")
-                if attempt < RETRY_COUNT - 1:
-                    time.sleep(RETRY_DELAY)
-                else:
-                    logger.error("Max retry attempts reached. Giving up on market data WebSocket.")
-                    break
+            
+            if shutdown.is_set():
+                logger.info("Market data WebSocket closed as requested")
+                break
+            
+            # run_forever gave up while we are still running - never leave the bot without klines
+            logger.warning(f"Market data WebSocket stopped unexpectedly. Reconnecting in {RETRY_DELAY}s...")
+            shutdown.wait(timeout=RETRY_DELAY)
     
-    def _start_user_stream(self):
-        """Start a WebSocket connection for user data"""
+    def _start_user_stream(self, reconnect_evt, pool):
+        """Run one user data WebSocket connection until it is closed"""
         if not self.listen_key:
             logger.warning("No listen key available for user data stream")
             return
@@ -309,116 +456,144 @@ class BinanceWebSocketManager:
         # Connect to user data stream
         user_stream_url = f"{self.BINANCE_WS_URL}/{self.listen_key}"
         
-        # Connect with retry logic
-        for attempt in range(RETRY_COUNT):
-            try:
-                ws_app = websocket.WebSocketApp(
-                    user_stream_url,
-                    on_message=self._on_user_message,
-                    on_error=self._on_user_error,
-                    on_close=self._on_user_close,
-                    on_open=self._on_user_open
-                )
-                
-                self.ws_user = ws_app
-                self.user_stream_connected = True
-                logger.info(f"Starting user data WebSocket connection (attempt {attempt+1})")
-                ws_app.run_forever()
-                
-                # If we reach here, connection closed intentionally or unintentionally
-                if not self.running:
-                    logger.info("User data WebSocket closed as requested")
-                    self.user_stream_connected = False
-                    break
-                    
-                logger.warning(f"User data WebSocket connection lost. Reconnecting...")
-                time.sleep(RETRY_DELAY)
-                self.user_stream_connected = False
-                
-            except Exception as e:
-                logger.error(f"Error in user data WebSocket: {e}")
-                self.user_stream_connected = False
-                if attempt < RETRY_COUNT - 1:
-                    time.sleep(RETRY_DELAY)
-                else:
-                    logger.error("Max retry attempts reached. Giving up on user data WebSocket.")
-                    break
+        # Connect; run_forever reconnects by itself until the socket is closed
+        try:
+            ws_app = websocket.WebSocketApp(
+                user_stream_url,
+                on_message=functools.partial(self._on_user_message, pool),
+                on_error=self._on_user_error,
+                on_close=self._on_user_close,
+                on_open=functools.partial(self._on_user_open, reconnect_evt)
+            )
+            
+            self.ws_user = ws_app
+            if reconnect_evt.is_set():
+                return  # Restart requested before the socket existed; reconnect with the new key
+            logger.info("Starting user data WebSocket connection")
+            ws_app.run_forever(**self.RUN_FOREVER_OPTIONS)
+        except Exception as e:
+            logger.error(f"Error in user data WebSocket: {e}")
+    
+    def _supervise_user_stream(self, shutdown, reconnect_evt, pool):
+        """Run the user data stream, reconnecting on restart requests or whenever it stops, until stop()"""
+        while not shutdown.is_set():
+            reconnect_evt.clear()
+            
+            # Blocks until the socket is closed by stop(), a restart request or the server
+            self._start_user_stream(reconnect_evt, pool)
+            
+            # This thread owns the user socket and its connected flag
+            self.ws_user = None
+            self.user_stream_connected = False
+            
+            if shutdown.is_set():
+                logger.info("User data WebSocket closed as requested")
+                break
+            if not reconnect_evt.is_set():
+                # run_forever returned on its own, e.g. after a server close - retry after a pause
+                logger.warning(f"User data WebSocket stopped unexpectedly. Reconnecting in {RETRY_DELAY}s...")
+                reconnect_evt.wait(timeout=RETRY_DELAY)
     
     def _restart_user_stream(self):
         """Restart the user data stream with a new listen key"""
-        if self.ws_user:
-            self.ws_user.close()
-            self.ws_user = None
-        
-        self.user_stream_connected = False
-        if self.listen_key:
-            self.user_ws_thread = threading.Thread(target=self._start_user_stream)
-            self.user_ws_thread.daemon = True
-            self.user_ws_thread.start()
+        # Flag the restart, then close the socket; the supervisor reconnects once it is down
+        self._user_reconnect_evt.set()
+        ws = self.ws_user
+        if ws is not None:
+            ws.close()
+    
+    def _on_message(self, in_q, ws, message):
+        """Queue market data WebSocket messages for the processor thread"""
+        # in_q is the queue of the run that opened this socket, so a late frame after a restart
+        # never lands in the next run's queue
+        self._enqueue_market_message(in_q, message)
+    
+    def _enqueue_market_message(self, in_q, message):
+        """Queue a market message without blocking, dropping the oldest frames while the queue is full"""
+        while True:
+            try:
+                in_q.put_nowait(message)
+                return
+            except queue.Full:
+                pass
+            
+            # Newer frames supersede older ones for klines and tickers, so stale data goes first
+            try:
+                dropped = in_q.get_nowait()
+            except queue.Empty:
+                continue
+            if dropped is None:
+                # Stopping: keep the sentinel and discard this message instead
+                message = None
+                continue
+            
+            self._dropped_messages += 1
+            if self._dropped_messages % 1000 == 1:
+                logger.warning(f"Market data processing is falling behind; dropped {self._dropped_messages} queued messages")
+    
+    def _process_market_messages(self, in_q):
+        """Drain queued market messages in batches until stop() sends the None sentinel"""
+        batch_size = self.MESSAGE_BATCH_SIZE
+        while True:
+            # Block for the first frame, then take whatever else has already arrived
+            batch = [in_q.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(in_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for message in batch:
+                if message is None:
+                    return
+                self._handle_market_message(message)
     
-    def _on_message(self, ws, message):
-        """Handle market data WebSocket messages"""
+    def _handle_market_message(self, message):
+        """Parse a market data message and dispatch it to its stream processor"""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             
             # Check if it's a combined stream format
             if 'data' in data and 'stream' in data:
                 stream = data['stream']
-                event_data = data['data']
                 
-                # Handle kline data
-                if 'kline' in stream:
-                    self._process_kline_data(event_data)
-                
-                # Handle trade data
-                elif 'trade' in stream:
-                    self._process_trade_data(event_data)
-                
-                # Handle book ticker data
-                elif 'bookTicker' in stream:
-                    self._process_book_ticker_data(event_data)
+                # Hand the event to the processor for its stream type
+                handler = self._stream_dispatch.get(stream.rsplit('@', 1)[-1].split('_', 1)[0])
+                if handler is not None:
+                    handler(data['data'])
             else:
                 logger.debug(f"Received unknown message format: {message[:100]}...")
         except Exception as e:
             logger.error(f"Error processing WebSocket message: {e}")
     
-    def _on_user_message(self, ws, message):
-        """Handle user data WebSocket messages"""
+    def _on_user_message(self, pool, ws, message):
+        """Handle user data WebSocket messages on the parse pool of the run that opened this socket"""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             
-            # Handle different event types
+            # Handle different event types; every event goes through the one-worker pool so
+            # e.g. a margin call is never handled before the position update sent ahead of it
             event_type = data.get('e', '')
-            
-            # Account update
-            if event_type == 'ACCOUNT_UPDATE':
-                self._process_account_update(data)
-                
-            # Order update
-            elif event_type == 'ORDER_TRADE_UPDATE':
-                self._process_order_update(data)
-                
-            # Position update
-            elif event_type == 'MARGIN_CALL':
-                self._process_margin_call(data)
-            
-            # Account config update
-            elif event_type == 'ACCOUNT_CONFIG_UPDATE':
-                logger.info(f"Account configuration updated: {data}")
-                
-            # Handle listen key expired
-            elif event_type == 'listenKeyExpired':
-                logger.warning("Listen key expired. Getting a new one...")
-                self.listen_key = self._get_listen_key()
-                if self.listen_key:
-                    self._restart_user_stream()
-            
+            handler = self._user_dispatch.get(event_type)
+            if handler is not None:
+                try:
+                    pool.submit(self._run_user_handler, handler, data)
+                except RuntimeError:
+                    # stop() already shut the pool down; events arriving while closing are dropped
+                    logger.debug(f"Dropped {event_type} received during shutdown")
             else:
                 logger.debug(f"Received unknown user data event: {event_type}")
                 
         except Exception as e:
             logger.error(f"Error processing user data message: {e}")
     
+    def _run_user_handler(self, handler, data):
+        """Run a user data handler on the parse pool, logging errors the future would otherwise hide"""
+        try:
+            handler(data)
+        except Exception as e:
+            logger.error(f"Error processing user data message: {e}")
+    
     def _on_error(self, ws, error):
         """Handle market data WebSocket errors"""
         logger.error(f"Market data WebSocket error: {error}")
@@ -431,86 +606,61 @@ class BinanceWebSocketManager:
     def _on_close(self, ws, close_status_code, close_msg):
         """Handle market data WebSocket closure"""
         logger.info(f"Market data WebSocket closed: {close_status_code} {close_msg}")
-        
-        # Auto-reconnect if not intentionally stopped and running
-        if self.running:
-            # Use lock to prevent multiple reconnection attempts
-            with self.reconnect_lock:
-                if not self.is_reconnecting:
-                    self.is_reconnecting = True
-                    time.sleep(1)
-                    # Start a new thread for reconnection
-                    threading.Thread(target=self._reconnect_market_stream).start()
-    
-    def _reconnect_market_stream(self):
-        """Handle reconnection of market data stream"""
-        try:
-            # Close existing connection if any
-            if self.ws:
-                try:
-                    self.ws.close()
-                except:
-                    pass
-                self.ws = None
-                
-            # Start a new connection
-            logger.info("Attempting to reconnect market data WebSocket...")
-            self._start_market_stream()
-        finally:
-            # Reset reconnection flag
-            with self.reconnect_lock:
-                self.is_reconnecting = False
     
     def _on_user_close(self, ws, close_status_code, close_msg):
         """Handle user data WebSocket closure"""
         logger.info(f"User data WebSocket closed: {close_status_code} {close_msg}")
         self.user_stream_connected = False
-        
-        # Auto-reconnect if not intentionally stopped and running
-        if self.running:
-            time.sleep(1)
-            # Create a new thread for user stream reconnection
-            new_thread = threading.Thread(target=self._start_user_stream)
-            new_thread.daemon = True
-            new_thread.start()
     
     def _on_open(self, ws):
         """Handle market data WebSocket opening"""
         logger.info("Market data WebSocket connected")
         
-    def _on_user_open(self, ws):
+    def _on_user_open(self, reconnect_evt, ws):
         """Handle user data WebSocket opening"""
+        if reconnect_evt.is_set():
+            ws.close()  # A restart was requested while connecting; the supervisor reconnects with the new key
+            return
         logger.info("User data WebSocket connected")
         self.user_stream_connected = True
     
     def _process_kline_data(self, data):
         """Process kline (candlestick) data"""
-        # Extract and format kline data
-        kline = data.get('k', {})
-        symbol = kline.get('s', '')
-        
-        # Update last kline data for this symbol
-        self.last_kline_data[symbol] = {
-            'open_time': kline.get('t'),
-            'open': float(kline.get('o')),
-            'high': float(kline.get('h')),
-            'low': float(kline.get('l')),
-            'close': float(kline.get('c')),
-            'volume': float(kline.get('v')),
-            'close_time': kline.get('T'),
-            'is_closed': kline.get('x', False)
-        }
+        # Extract and format kline data; only the symbol and close price are required, the other
+        # fields fall back to defaults so one missing field does not drop the whole kline
+        kline = data['k']
+        symbol = kline['s']
+        close = float(kline['c'])
+        is_closed = kline.get('x', False)
+        open_price = float(kline.get('o', close))
+        high = float(kline.get('h', close))
+        low = float(kline.get('l', close))
+        volume = float(kline.get('v', 0))
+        
+        # Update last kline data for this symbol; the snapshot is immutable, so callbacks and
+        # get_last_kline callers can keep it without later frames changing it underneath them
+        kline_data = KlineSnapshot(
+            kline.get('t'), open_price, high, low, close, volume, kline.get('T'), is_closed
+        )
+        self.last_kline_data[symbol] = kline_data
         
         # If kline is closed and we have a callback, call it
-        if kline.get('x', False) and 'kline' in self.callbacks:
-            self.callbacks['kline'](symbol, self.last_kline_data[symbol])
+        callback = self._cb_kline
+        if is_closed and callback is not None:
+            callback(symbol, kline_data)
             
         # Always call real-time kline callback if registered
-        if 'kline_update' in self.callbacks:
-            self.callbacks['kline_update'](symbol, self.last_kline_data[symbol])
+        callback = self._cb_kline_update
+        if callback is not None:
+            callback(symbol, kline_data)
     
     def _process_trade_data(self, data):
         """Process trade data"""
+        # Nothing consumes trades without a callback, so skip building them
+        callback = self._cb_trade
+        if callback is None:
+            return
+        
         trade_data = {
             'symbol': data.get('s', ''),
             'price': float(data.get('p', 0)),
@@ -520,12 +670,15 @@ class BinanceWebSocketManager:
             'trade_id': data.get('t', 0)
         }
         
-        # Call trade callback if registered
-        if 'trade' in self.callbacks:
-            self.callbacks['trade'](trade_data['symbol'], trade_data)
+        callback(trade_data['symbol'], trade_data)
     
     def _process_book_ticker_data(self, data):
         """Process book ticker data (best bid/ask)"""
+        # Nothing consumes book tickers without a callback, so skip building them
+        callback = self._cb_book_ticker
+        if callback is None:
+            return
+        
         ticker_data = {
             'symbol': data.get('s', ''),
             'bid_price': float(data.get('b', 0)),
@@ -535,9 +688,7 @@ class BinanceWebSocketManager:
             'time': data.get('E', 0)
         }
         
-        # Call book ticker callback if registered
-        if 'book_ticker' in self.callbacks:
-            self.callbacks['book_ticker'](ticker_data['symbol'], ticker_data)
+        callback(ticker_data['symbol'], ticker_data)
     
     def _process_account_update(self, data):
         """Process account update data"""
@@ -566,14 +717,22 @@ class BinanceWebSocketManager:
             }
         
         # Call account update callback if registered
-        if 'account_update' in self.callbacks:
-            self.callbacks['account_update'](balance_updates, position_updates)
+        callback = self._cb_account_update
+        if callback is not None:
+            callback(balance_updates, position_updates)
     
     def _process_order_update(self, data):
         """Process order update data"""
-        order = data.get('o', {})
+        # Nothing consumes the update without a callback, so skip building it
+        callback = self._cb_order_update
+        if callback is None:
+            return
+        
+        # Only symbol, id, status and execution type are guaranteed; the rest fall back to defaults
+        # so a missing field does not drop the whole update
+        order = data['o']
         order_data = {
-            'symbol': order.get('s', ''),
+            'symbol': order['s'],
             'client_order_id': order.get('c', ''),
             'side': order.get('S', ''),
             'type': order.get('o', ''),
@@ -582,22 +741,20 @@ class BinanceWebSocketManager:
             'price': float(order.get('p', 0)),
             'avg_price': float(order.get('ap', 0)),
             'stop_price': float(order.get('sp', 0)),
-            'execution_type': order.get('x', ''),
-            'order_status': order.get('X', ''),
-            'order_id': order.get('i', 0),
+            'execution_type': order['x'],
+            'order_status': order['X'],
+            'order_id': order['i'],
             'filled_quantity': float(order.get('l', 0)),
             'cumulative_filled_quantity': float(order.get('z', 0)),
             'last_filled_price': float(order.get('L', 0)),
-            'commission': float(order.get('n', 0)),
+            'commission': float(order.get('n', 0) or 0),
             'commission_asset': order.get('N', ''),
             'trade_time': order.get('T', 0),
             'trade_id': order.get('t', 0),
             'realized_profit': float(order.get('rp', 0))
         }
         
-        # Call order update callback if registered
-        if 'order_update' in self.callbacks:
-            self.callbacks['order_update'](order_data)
+        callback(order_data)
     
     def _process_margin_call(self, data):
         """Process margin call data"""
@@ -618,16 +775,28 @@ class BinanceWebSocketManager:
             margin_calls.append(margin_call)
         
         # Call margin call callback if registered
-        if 'margin_call' in self.callbacks:
-            self.callbacks['margin_call'](margin_calls)
+        callback = self._cb_margin_call
+        if callback is not None:
+            callback(margin_calls)
+    
+    def _process_account_config_update(self, data):
+        """Process account configuration update data"""
+        logger.info(f"Account configuration updated: {data}")
+    
+    def _process_listen_key_expired(self, data):
+        """Replace an expired listen key and restart the user data stream"""
+        logger.warning("Listen key expired. Getting a new one...")
+        self.listen_key = self._get_listen_key()
+        if self.listen_key:
+            self._restart_user_stream()
     
-    def get_last_kline(self, symbol: str) -> Dict:
-        """Get the last received kline data for a symbol"""
+    def get_last_kline(self, symbol: str) -> Union[KlineSnapshot, Dict]:
+        """Get the last received kline snapshot for a symbol, or an empty dict if none arrived yet"""
         return self.last_kline_data.get(symbol, {})
     
     def get_symbols(self) -> List[str]:
         """Get list of symbols currently tracked"""
-        return self.symbols.copy()
+        return list(self._symbols_snapshot)
     
     def is_connected(self) -> bool:
         """Check if WebSocket is connected"""